@@ -44,45 +44,22 @@ async def admin_stats() -> dict[str, int]:
     Returns:
         Dict with counts of reminders, pending feedback, drafts, forms, and users
     """
-    stats = {}
-
-    # Count reminders sent
-    stats["reminders_sent"] = await db.fetchval(
-        """
-        SELECT COUNT(*) FROM feedback_reminders_sent
-    """
-    )
-
-    # Count pending feedback
-    stats["pending_feedback"] = await db.fetchval(
-        """
-        SELECT COUNT(*) FROM feedback_reminders_sent
-        WHERE submitted_at IS NULL
-    """
-    )
-
-    # Count active drafts
-    stats["active_drafts"] = await db.fetchval(
-        """
-        SELECT COUNT(*) FROM feedback_drafts
-    """
-    )
-
-    # Count feedback forms
-    stats["feedback_forms"] = await db.fetchval(
+    # Fetch all counts in a single round-trip
+    row = await db.fetchrow(
         """
-        SELECT COUNT(*) FROM feedback_form_definitions
-        WHERE NOT is_archived
+        SELECT
+            (SELECT COUNT(*) FROM feedback_reminders_sent) AS reminders_sent,
+            (SELECT COUNT(*) FROM feedback_reminders_sent
+             WHERE submitted_at IS NULL) AS pending_feedback,
+            (SELECT COUNT(*) FROM feedback_drafts) AS active_drafts,
+            (SELECT COUNT(*) FROM feedback_form_definitions
+             WHERE NOT is_archived) AS feedback_forms,
+            (SELECT COUNT(*) FROM slack_users
+             WHERE NOT deleted) AS slack_users
     """
     )
 
-    # Count Slack users
-    stats["slack_users"] = await db.fetchval(
-        """
-        SELECT COUNT(*) FROM slack_users
-        WHERE NOT deleted
-    """
-    )
+    stats: dict[str, int] = dict(row) if row else {}
 
-    logger.info("admin_stats_retrieved", **stats)
+    logger.info("admin_stats_retrieved", stats=stats)
     return stats
@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import time
+from collections.abc import Coroutine
 from datetime import UTC, datetime
 from typing import Any
+from urllib.parse import parse_qs
 
+import orjson
 from fastapi import APIRouter, Request, Response
-from fastapi.datastructures import UploadFile
+from slack_sdk.errors import SlackApiError
 from structlog import get_logger
 
 from app.clients import ashby, slack
@@ -19,12 +22,45 @@ from app.clients.slack_parsers import (
 from app.clients.slack_views import build_feedback_modal
 from app.services import feedback
 from app.services.sync import get_feedback_form_definition
-from app.types.ashby import CandidateTD, FeedbackFormTD
 from app.types.slack import InterviewDataTD
 
 logger = get_logger()
 router = APIRouter()
 
+# Kept as a single constant so every call sends identical SQL text and hits
+# asyncpg's per-connection prepared statement cache after the first use
+INTERVIEW_EVENT_QUERY = """
+    SELECT ie.start_time, ie.end_time, ie.meeting_link,
+           i.title AS interview_title, i.instructions_plain
+    FROM interview_events ie
+    JOIN interviews i ON ie.interview_id = i.interview_id
+    WHERE ie.event_id = $1
+"""
+
+# Users whose last best-effort DM failed (user_id → monotonic time to retry after)
+DM_FAILURE_BACKOFF_SECONDS = 60
+DM_FAILURE_CACHE_MAX_SIZE = 1024
+# Slack errors that won't clear up on retry; transient failures never back off
+PERMANENT_DM_ERRORS = frozenset(
+    {"user_not_found", "cannot_dm_bot", "account_inactive", "channel_not_found"}
+)
+_dm_fail_until: dict[str, float] = {}
+
+# Strong references to fire-and-forget tasks so they aren't garbage collected mid-flight
+_background_tasks: set[asyncio.Task[None]] = set()
+
+
+def _spawn(coro: Coroutine[Any, Any, None]) -> None:
+    """Run coroutine in the background without awaiting it."""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+def clear_dm_failures() -> None:
+    """Forget all recorded DM failures."""
+    _dm_fail_until.clear()
+
 
 @router.post("/slack/interactions")
 async def handle_slack_interactions(request: Request) -> Response:
@@ -38,18 +74,21 @@ async def handle_slack_interactions(request: Request) -> Response:
     - view_submission: Final feedback submission
     - view_closed: Modal dismissal (logging only)
     """
-    form_data = await request.form()
-    payload_str = form_data.get("payload")
-    if not payload_str or isinstance(payload_str, UploadFile):
+    # Slack always posts a single url-encoded "payload" field - decode it directly
+    # rather than going through Starlette's general form/multipart parser
+    body = await request.body()
+    payload_values = parse_qs(body.decode()).get("payload")
+    if not payload_values:
         return Response(status_code=400)
-    payload = json.loads(payload_str)
+    payload = orjson.loads(payload_values[0])
 
     # Handle button clicks (open modal)
     if payload["type"] == "block_actions":
         action = payload["actions"][0]
 
         if action["action_id"] == "open_feedback_modal":
-            await handle_open_modal(payload, action)
+            # Ack immediately; trigger_id stays valid for ~3s while the modal builds
+            _spawn(handle_open_modal(payload, action))
         elif action["action_id"].startswith("field_"):
             # Handle Enter key press in text fields (dispatch action)
             await handle_dispatch_auto_save(payload)
@@ -60,7 +99,7 @@ async def handle_slack_interactions(request: Request) -> Response:
     elif payload["type"] == "view_submission":
         if payload["view"]["callback_id"] == "submit_feedback":
             # Run async to avoid blocking Slack's 3-second timeout
-            asyncio.create_task(handle_feedback_submission(payload))
+            _spawn(handle_feedback_submission(payload))
 
         return Response(status_code=200)
 
@@ -85,39 +124,34 @@ async def handle_open_modal(payload: dict[str, Any], action: dict[str, Any]) ->
     """
     try:
         # Extract data from button value (Slack-specific)
-        button_data = json.loads(action["value"])
+        button_data = orjson.loads(action["value"])
         event_id = button_data["event_id"]
         form_definition_id = button_data["form_definition_id"]
         application_id = button_data["application_id"]
         interviewer_id = button_data["interviewer_id"]
         candidate_id = button_data["candidate_id"]
 
-        # Get feedback form definition (business logic)
-        form_def: FeedbackFormTD | None = await get_feedback_form_definition(form_definition_id)
+        # Fetch interview data from database
+        from app.core.database import db
 
+        # Check the form first (usually memoized) so a missing form costs no Ashby call
+        form_def = await get_feedback_form_definition(form_definition_id)
         if not form_def:
             logger.error("form_definition_not_found", form_id=form_definition_id)
             return
 
-        # Load existing draft if any (business logic)
-        draft_values = await feedback.load_draft(event_id, interviewer_id)
-
-        # Fetch candidate data
-        candidate_data: CandidateTD = await ashby.fetch_candidate_info(candidate_id)
-
-        # Fetch interview data from database
-        from app.core.database import db
-
-        interview_row = await db.fetchrow(
-            """
-            SELECT ie.start_time, ie.end_time, ie.meeting_link,
-                   i.title AS interview_title, i.instructions_plain
-            FROM interview_events ie
-            JOIN interviews i ON ie.interview_id = i.interview_id
-            WHERE ie.event_id = $1
-            """,
-            event_id,
+        # Draft, candidate and interview lookups are independent - run them concurrently.
+        # return_exceptions so a failure doesn't leave the other lookups' errors unretrieved
+        results = await asyncio.gather(
+            feedback.load_draft(event_id, interviewer_id),
+            ashby.fetch_candidate_info(candidate_id),
+            db.fetchrow(INTERVIEW_EVENT_QUERY, event_id),
+            return_exceptions=True,
         )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        draft_values, candidate_data, interview_row = results
 
         interview_data: InterviewDataTD = {
             "event_id": event_id,
@@ -159,7 +193,7 @@ async def handle_dispatch_auto_save(payload: dict[str, Any]) -> None:
     """
     try:
         # Extract metadata from modal (Slack-specific)
-        metadata = json.loads(payload["view"]["private_metadata"])
+        metadata = orjson.loads(payload["view"]["private_metadata"])
         event_id = metadata["event_id"]
         interviewer_id = metadata["interviewer_id"]
 
@@ -187,7 +221,7 @@ async def handle_feedback_submission(payload: dict[str, Any]) -> None:
     """
     try:
         # Extract metadata from modal (Slack-specific)
-        metadata = json.loads(payload["view"]["private_metadata"])
+        metadata = orjson.loads(payload["view"]["private_metadata"])
         event_id = metadata["event_id"]
         form_definition_id = metadata["form_definition_id"]
         application_id = metadata["application_id"]
@@ -215,13 +249,16 @@ async def handle_feedback_submission(payload: dict[str, Any]) -> None:
             field_submissions=field_submissions,
         )
 
-        # Send confirmation DM to user (Slack-specific)
-        await slack.slack_client.send_dm(
-            slack_user_id,
-            (
-                "✅ *Feedback submitted successfully*\n\n"
-                "Thank you for completing the interview feedback!"
-            ),
+        # Send confirmation DM to user (Slack-specific) - submission is already
+        # complete, so don't hold this task open on Slack's API
+        _spawn(
+            _send_dm_best_effort(
+                slack_user_id,
+                (
+                    "✅ *Feedback submitted successfully*\n\n"
+                    "Thank you for completing the interview feedback!"
+                ),
+            )
         )
 
         logger.info("feedback_submitted_successfully", event_id=event_id)
@@ -230,11 +267,34 @@ async def handle_feedback_submission(payload: dict[str, Any]) -> None:
         logger.exception("failed_to_process_feedback_submission", error=str(e))
 
         # Notify user of error (Slack-specific, best effort)
-        try:
-            await slack.slack_client.send_dm(
-                payload["user"]["id"],
-                f"❌ *Failed to submit feedback*\n\n{str(e)}",
-            )
-        except Exception:
-            # Suppress errors in error notification to avoid cascading failures
-            pass
+        user_id = payload.get("user", {}).get("id")
+        if user_id:
+            await _send_dm_best_effort(user_id, f"❌ *Failed to submit feedback*\n\n{str(e)}")
+
+
+async def _send_dm_best_effort(user_id: str, text: str) -> None:
+    """
+    Send a DM, ignoring failures (send_dm already logs them).
+
+    Skips users whose last DM failed permanently (see PERMANENT_DM_ERRORS)
+    within DM_FAILURE_BACKOFF_SECONDS, so an unreachable user doesn't cost a
+    doomed API call per attempt. Transient failures are retried on the next call.
+    """
+    retry_after = _dm_fail_until.get(user_id)
+    if retry_after is not None:
+        if retry_after > time.monotonic():
+            logger.info("slack_dm_skipped_recent_failure", user_id=user_id)
+            return
+        del _dm_fail_until[user_id]
+
+    try:
+        await slack.slack_client.send_dm(user_id, text)
+    except Exception as e:
+        # Suppress errors in best-effort notifications to avoid cascading failures
+        if not (isinstance(e, SlackApiError) and e.response.get("error") in PERMANENT_DM_ERRORS):
+            return
+        _dm_fail_until.pop(user_id, None)
+        if len(_dm_fail_until) >= DM_FAILURE_CACHE_MAX_SIZE:
+            # Evict oldest entry (dicts preserve insertion order)
+            _dm_fail_until.pop(next(iter(_dm_fail_until)))
+        _dm_fail_until[user_id] = time.monotonic() + DM_FAILURE_BACKOFF_SECONDS
@@ -2,17 +2,17 @@
 
 from __future__ import annotations
 
-import json
-from typing import Any
+from typing import Any, cast
 
+import orjson
 from fastapi import APIRouter, HTTPException, Request, Response
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 from structlog import get_logger
 
 from app.core.config import settings
-from app.core.database import db
 from app.models.webhooks import AshbyWebhookPayload
+from app.services.audit import webhook_audit
 from app.utils.security import verify_ashby_signature
 
 logger = get_logger()
@@ -21,6 +21,11 @@ router = APIRouter()
 # Initialize rate limiter
 limiter = Limiter(key_func=get_remote_address)
 
+# Reject oversized bodies before doing any work on them
+MAX_WEBHOOK_BODY_BYTES = 1024 * 1024
+# Unsigned requests are only accepted for Ashby's tiny ping payload
+MAX_UNSIGNED_BODY_BYTES = 1024
+
 
 @router.post("/webhooks/ashby")
 @limiter.limit("100/minute")
@@ -32,37 +37,39 @@ async def handle_ashby_webhook(request: Request) -> Response:
     - Ping/test webhooks (returns 200 for setup verification)
     - Interview schedule updates with signature verification
 
-    Returns 200/204 on success, 401/400 on errors.
+    Signature is verified before the body is parsed so unauthenticated
+    traffic cannot spend CPU on JSON decoding.
+
+    Returns 200/204 on success, 401/400/413 on errors.
     """
-    # Get raw body
-    body = await request.body()
+    body = await _read_body(request)
 
-    # Parse payload first to check if it's a ping
-    try:
-        payload_dict = json.loads(body)
-    except json.JSONDecodeError as e:
-        logger.error("webhook_invalid_json")
-        raise HTTPException(status_code=400, detail="Invalid JSON") from e
+    # Ashby uses "Ashby-Signature" header (not "X-Ashby-Signature")
+    signature = request.headers.get("Ashby-Signature")
+
+    if signature:
+        # Verify signature before parsing (constant-time comparison)
+        if not verify_ashby_signature(settings.ashby_webhook_secret, body, signature):
+            logger.warning("webhook_signature_verification_failed")
+            raise HTTPException(status_code=401, detail="Invalid signature")
+    elif len(body) > MAX_UNSIGNED_BODY_BYTES:
+        # Only small ping payloads may arrive unsigned - don't parse anything else
+        logger.warning("webhook_missing_signature_header")
+        raise HTTPException(status_code=401, detail="Missing Ashby-Signature header")
+
+    payload_dict = _parse_json(body)
 
     # Handle ping/test webhook (no signature required)
     # Ashby sends this during webhook setup to verify the URL works
     if payload_dict.get("action") == "ping" or payload_dict.get("type") == "ping":
         logger.info("webhook_ping_received")
-        return Response(status_code=200, content=json.dumps({"status": "ok"}))
+        return Response(status_code=200, content=orjson.dumps({"status": "ok"}))
 
     # For real webhooks, require signature
-    # Ashby uses "Ashby-Signature" header (not "X-Ashby-Signature")
-    signature = request.headers.get("Ashby-Signature")
-
     if not signature:
         logger.warning("webhook_missing_signature_header")
         raise HTTPException(status_code=401, detail="Missing Ashby-Signature header")
 
-    # Verify signature (constant-time comparison)
-    if not verify_ashby_signature(settings.ashby_webhook_secret, body, signature):
-        logger.warning("webhook_signature_verification_failed")
-        raise HTTPException(status_code=401, detail="Invalid signature")
-
     # Validate payload structure
     try:
         payload = AshbyWebhookPayload(**payload_dict)
@@ -70,23 +77,12 @@ async def handle_ashby_webhook(request: Request) -> Response:
         logger.error("webhook_validation_failed", error=str(e))
         raise HTTPException(status_code=400, detail="Invalid payload structure") from e
 
-    logger.info(
-        "webhook_received",
-        action=payload.action,
-        schedule_id=payload.data.get("interviewSchedule", {}).get("id"),
-    )
-
-    # Log to audit table
     schedule_id = payload.data.get("interviewSchedule", {}).get("id")
-    await db.execute(
-        """
-        INSERT INTO ashby_webhook_payloads (schedule_id, received_at, action, payload)
-        VALUES ($1, NOW(), $2, $3)
-    """,
-        schedule_id,
-        payload.action,
-        json.dumps(payload_dict),
-    )
+    logger.info("webhook_received", action=payload.action, schedule_id=schedule_id)
+
+    # Log to audit table (batched, written off the request path)
+    # Raw body is already valid JSON - store it as-is rather than re-encoding
+    webhook_audit.enqueue(schedule_id, payload.action, body)
 
     # Process based on action
     if payload.action == "interviewScheduleUpdate":
@@ -97,6 +93,46 @@ async def handle_ashby_webhook(request: Request) -> Response:
     return Response(status_code=204)
 
 
+async def _read_body(request: Request) -> bytes:
+    """
+    Read the raw body, raising 413 once it exceeds MAX_WEBHOOK_BODY_BYTES.
+
+    A declared Content-Length is checked before anything is read; the stream
+    is then counted as it arrives so chunked or mislabelled bodies are cut off
+    without buffering more than the limit.
+    """
+    content_length = request.headers.get("Content-Length", "")
+    if content_length.isdigit() and int(content_length) > MAX_WEBHOOK_BODY_BYTES:
+        logger.warning("webhook_body_too_large", size=int(content_length))
+        raise HTTPException(status_code=413, detail="Payload too large")
+
+    chunks: list[bytes] = []
+    size = 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > MAX_WEBHOOK_BODY_BYTES:
+            logger.warning("webhook_body_too_large", size=size)
+            raise HTTPException(status_code=413, detail="Payload too large")
+        chunks.append(chunk)
+
+    return b"".join(chunks)
+
+
+def _parse_json(body: bytes) -> dict[str, Any]:
+    """Parse webhook body, raising 400 on malformed JSON."""
+    try:
+        payload_dict = orjson.loads(body)
+    except orjson.JSONDecodeError as e:
+        logger.error("webhook_invalid_json")
+        raise HTTPException(status_code=400, detail="Invalid JSON") from e
+
+    if not isinstance(payload_dict, dict):
+        logger.error("webhook_invalid_json")
+        raise HTTPException(status_code=400, detail="Invalid JSON")
+
+    return cast(dict[str, Any], payload_dict)
+
+
 async def handle_interview_schedule_update(data: dict[str, Any]) -> None:
     """
     Process interviewScheduleUpdate webhook.
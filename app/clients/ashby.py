@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import time
+from collections.abc import Iterable
 from typing import Any, cast
 
 import aiohttp
+import orjson
 from structlog import get_logger
 
 from app.core.config import settings
 from app.types.ashby import CandidateTD
+from app.utils.locks import KeyedLocks
 
 logger = get_logger()
 
@@ -22,7 +27,8 @@ class AshbyClient:
         self.api_key = settings.ashby_api_key
         self.base_url = "https://api.ashbyhq.com"
 
-        # Basic auth: base64(api_key:)
+        # Basic auth: base64(api_key:) - encoded once and baked into the session
+        # defaults, so requests never pass (and merge) per-call headers
         credentials = base64.b64encode(f"{self.api_key}:".encode()).decode()
         self.headers = {
             "Authorization": f"Basic {credentials}",
@@ -30,6 +36,33 @@ class AshbyClient:
             "Content-Type": "application/json",
         }
 
+        # Shared session (keep-alive connection pool), opened on app startup
+        self._session: aiohttp.ClientSession | None = None
+
+        # Full endpoint URLs, built once per endpoint
+        self._url_cache: dict[str, str] = {}
+
+    async def connect(self) -> None:
+        """Open the shared HTTP session on startup."""
+        self._get_session()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, opening it if needed (e.g. outside app lifespan)."""
+        if not self._session or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=60),
+            )
+            logger.info("ashby_client_connected")
+        return self._session
+
+    async def disconnect(self) -> None:
+        """Close the shared HTTP session on shutdown."""
+        if self._session:
+            await self._session.close()
+            self._session = None
+            logger.info("ashby_client_disconnected")
+
     async def post(self, endpoint: str, json_data: dict[str, Any]) -> dict[str, Any]:
         """
         Make POST request to Ashby API.
@@ -44,46 +77,66 @@ class AshbyClient:
         Raises:
             aiohttp.ClientError: On request failure
         """
-        url = f"{self.base_url}/{endpoint}"
+        url = self._url_cache.get(endpoint)
+        if url is None:
+            url = self._url_cache[endpoint] = f"{self.base_url}/{endpoint}"
 
         logger.info("ashby_api_request", endpoint=endpoint)
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, json=json_data, headers=self.headers) as response:
-                response.raise_for_status()
-                result: dict[str, Any] = await response.json()
+        async with self._get_session().post(url, json=json_data) as response:
+            response.raise_for_status()
+            result: dict[str, Any] = await response.json(loads=orjson.loads)
 
-                if not result.get("success"):
-                    # Extract error from multiple possible fields
-                    error_msg = result.get("errors") or result.get("error") or "Unknown error"
-                    error_info = result.get("errorInfo", {})
+            if not result.get("success"):
+                # Extract error from multiple possible fields
+                error_msg = result.get("errors") or result.get("error") or "Unknown error"
+                error_info = result.get("errorInfo", {})
 
-                    logger.error(
-                        "ashby_api_error",
-                        endpoint=endpoint,
-                        errors=error_msg,
-                        error_code=(
-                            error_info.get("code") if isinstance(error_info, dict) else None
-                        ),
-                        request_id=(
-                            error_info.get("requestId") if isinstance(error_info, dict) else None
-                        ),
-                    )
+                logger.error(
+                    "ashby_api_error",
+                    endpoint=endpoint,
+                    errors=error_msg,
+                    error_code=(error_info.get("code") if isinstance(error_info, dict) else None),
+                    request_id=(
+                        error_info.get("requestId") if isinstance(error_info, dict) else None
+                    ),
+                )
 
-                    # Raise exception to stop execution
-                    error_display = error_msg if isinstance(error_msg, str) else str(error_msg)
-                    raise Exception(f"Ashby API request failed ({endpoint}): {error_display}")
+                # Raise exception to stop execution
+                error_display = error_msg if isinstance(error_msg, str) else str(error_msg)
+                raise Exception(f"Ashby API request failed ({endpoint}): {error_display}")
 
-                return result
+            return result
 
 
 # Module-level singleton
 ashby_client = AshbyClient()
 
+# In-process TTL cache for candidate.info (candidate_id → (expires_at, data))
+CANDIDATE_CACHE_TTL_SECONDS = 120
+CANDIDATE_CACHE_MAX_SIZE = 1024
+_candidate_cache: dict[str, tuple[float, CandidateTD]] = {}
+_candidate_locks = KeyedLocks()
+
+
+def clear_candidate_cache() -> None:
+    """Drop all cached candidate.info responses."""
+    _candidate_cache.clear()
+
+
+def _get_cached_candidate(candidate_id: str) -> CandidateTD | None:
+    """Return cached candidate data if present and not expired."""
+    entry = _candidate_cache.get(candidate_id)
+    if entry and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
 
 async def fetch_candidate_info(candidate_id: str) -> CandidateTD:
     """
-    Fetch candidate details from Ashby API.
+    Fetch candidate details from Ashby API (cached for a short TTL).
+
+    Concurrent misses for the same candidate share a single API call.
 
     Args:
         candidate_id: Ashby candidate UUID
@@ -94,6 +147,30 @@ async def fetch_candidate_info(candidate_id: str) -> CandidateTD:
     Raises:
         Exception: If API call fails
     """
+    cached = _get_cached_candidate(candidate_id)
+    if cached is not None:
+        return cached
+
+    async with _candidate_locks.hold(candidate_id):
+        # Another caller may have filled the cache while we waited
+        cached = _get_cached_candidate(candidate_id)
+        if cached is not None:
+            return cached
+
+        data = await _fetch_candidate_info_uncached(candidate_id)
+
+        if len(_candidate_cache) >= CANDIDATE_CACHE_MAX_SIZE:
+            # Evict oldest entry (dicts preserve insertion order)
+            _candidate_cache.pop(next(iter(_candidate_cache)))
+        _candidate_cache[candidate_id] = (
+            time.monotonic() + CANDIDATE_CACHE_TTL_SECONDS,
+            data,
+        )
+        return data
+
+
+async def _fetch_candidate_info_uncached(candidate_id: str) -> CandidateTD:
+    """Fetch candidate details from Ashby API, bypassing the cache."""
     response = await ashby_client.post("candidate.info", {"id": candidate_id})
 
     if not response["success"]:
@@ -108,6 +185,38 @@ async def fetch_candidate_info(candidate_id: str) -> CandidateTD:
     return cast(CandidateTD, data)
 
 
+async def fetch_candidates(
+    candidate_ids: Iterable[str], concurrency: int = 8
+) -> dict[str, CandidateTD]:
+    """
+    Fetch several candidates concurrently, bounded to stay under Ashby rate limits.
+
+    Duplicate IDs are fetched once. Failed lookups are logged and omitted so
+    one bad candidate does not fail the whole batch.
+
+    Args:
+        candidate_ids: Ashby candidate UUIDs
+        concurrency: Maximum number of in-flight candidate.info requests
+
+    Returns:
+        Dict of candidate_id → candidate data for successful lookups
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch_one(candidate_id: str) -> CandidateTD | None:
+        async with semaphore:
+            try:
+                return await fetch_candidate_info(candidate_id)
+            except Exception as e:
+                logger.error("candidate_fetch_failed", candidate_id=candidate_id, error=str(e))
+                return None
+
+    unique_ids = list(dict.fromkeys(candidate_ids))
+    results = await asyncio.gather(*(fetch_one(cid) for cid in unique_ids))
+
+    return {cid: data for cid, data in zip(unique_ids, results, strict=True) if data is not None}
+
+
 async def fetch_resume_url(file_handle: str) -> str | None:
     """
     Convert Ashby file handle to actual S3 URL.
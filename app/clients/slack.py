@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import Any
 
+import aiohttp
 from slack_sdk.web.async_client import AsyncSlackResponse, AsyncWebClient
 from structlog import get_logger
 
@@ -18,6 +19,25 @@ class SlackClient:
     def __init__(self):
         self.client = AsyncWebClient(token=settings.slack_bot_token)
 
+    async def connect(self) -> None:
+        """
+        Open a shared keep-alive HTTP session on startup.
+
+        Without it the SDK opens a new session (and TLS connection) per API call.
+        """
+        if not self.client.session or self.client.session.closed:
+            self.client.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=60)
+            )
+            logger.info("slack_client_connected")
+
+    async def disconnect(self) -> None:
+        """Close the shared HTTP session on shutdown."""
+        if self.client.session:
+            await self.client.session.close()
+            self.client.session = None
+            logger.info("slack_client_disconnected")
+
     async def send_dm(
         self, user_id: str, text: str, blocks: list[dict[str, Any]] | None = None
     ) -> AsyncSlackResponse:
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Mapping
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
 from structlog import get_logger
@@ -10,6 +13,27 @@ from app.types.ashby import FormFieldConfigTD, FormFieldTD
 
 logger = get_logger()
 
+FieldBuilder = Callable[[FormFieldTD, FormFieldConfigTD, Any], dict[str, Any]]
+
+
+@lru_cache(maxsize=4096)
+def _plain_text(text: str) -> dict[str, Any]:
+    """Shared plain_text object for labels and option text (Slack only reads these)."""
+    return {"type": "plain_text", "text": text}
+
+
+# Static option/config payloads shared by every rendered block. Slack only reads
+# these, so one instance per process is enough.
+_SCORE_OPTIONS: tuple[dict[str, Any], ...] = tuple(
+    {
+        "text": _plain_text(f"{i} - {label}"),
+        "value": str(i),
+    }
+    for i, label in enumerate(["Strong No Hire", "No Hire", "Hire", "Strong Hire"], start=1)
+)
+_SCORE_OPTIONS_BY_VALUE = {opt["value"]: opt for opt in _SCORE_OPTIONS}
+_RICHTEXT_DISPATCH_CONFIG: dict[str, Any] = {"trigger_actions_on": ["on_enter_pressed"]}
+
 
 def build_text_field(
     field: FormFieldTD, field_config: FormFieldConfigTD, draft_value: Any = None
@@ -56,7 +80,7 @@ def build_richtext_field(
         "type": "plain_text_input",
         "action_id": field_path,
         "multiline": True,
-        "dispatch_action_config": {"trigger_actions_on": ["on_enter_pressed"]},
+        "dispatch_action_config": _RICHTEXT_DISPATCH_CONFIG,
     }
     if draft_value:
         # Extract plain text from Ashby RichText format if needed
@@ -108,18 +132,16 @@ def build_boolean_field(
 ) -> dict[str, Any]:
     """Build checkbox for Boolean fields."""
     field_path = field["path"]
-    label_text = field.get("title", field.get("humanReadablePath", "Field"))
     input_block = _create_input_block(field, field_config)
+    checkbox_option = {"text": input_block["label"], "value": "true"}
 
     input_block["element"] = {
         "type": "checkboxes",
         "action_id": field_path,
-        "options": [{"text": {"type": "plain_text", "text": label_text}, "value": "true"}],
+        "options": [checkbox_option],
     }
     if draft_value:
-        input_block["element"]["initial_options"] = [
-            {"text": {"type": "plain_text", "text": label_text}, "value": "true"}
-        ]
+        input_block["element"]["initial_options"] = [checkbox_option]
 
     return input_block
 
@@ -131,26 +153,16 @@ def build_score_field(
     field_path = field["path"]
     input_block = _create_input_block(field, field_config)
 
-    options = [
-        {
-            "text": {"type": "plain_text", "text": f"{i} - {label}"},
-            "value": str(i),
-        }
-        for i, label in enumerate(["Strong No Hire", "No Hire", "Hire", "Strong Hire"], start=1)
-    ]
-
     input_block["element"] = {
         "type": "static_select",
         "action_id": field_path,
-        "options": options,
+        "options": list(_SCORE_OPTIONS),
     }
 
     if draft_value:
         score_value = draft_value.get("score") if isinstance(draft_value, dict) else draft_value
-        if score_value:
-            input_block["element"]["initial_option"] = next(
-                (opt for opt in options if opt["value"] == str(score_value)), None
-            )
+        if score_value and (option := _SCORE_OPTIONS_BY_VALUE.get(str(score_value))):
+            input_block["element"]["initial_option"] = option
 
     return input_block
 
@@ -163,13 +175,7 @@ def build_select_field(
     input_block = _create_input_block(field, field_config)
 
     value_options = field.get("selectableValues", [])
-    options = [
-        {
-            "text": {"type": "plain_text", "text": opt["label"]},
-            "value": opt["value"],
-        }
-        for opt in value_options
-    ]
+    options = [{"text": _plain_text(opt["label"]), "value": opt["value"]} for opt in value_options]
 
     input_block["element"] = {
         "type": "static_select",
@@ -178,9 +184,9 @@ def build_select_field(
     }
 
     if draft_value and options:
-        input_block["element"]["initial_option"] = next(
-            (opt for opt in options if opt["value"] == draft_value), None
-        )
+        option = next((opt for opt in options if opt["value"] == draft_value), None)
+        if option:
+            input_block["element"]["initial_option"] = option
 
     return input_block
 
@@ -193,13 +199,7 @@ def build_multiselect_field(
     input_block = _create_input_block(field, field_config)
 
     value_options = field.get("selectableValues", [])
-    options = [
-        {
-            "text": {"type": "plain_text", "text": opt["label"]},
-            "value": opt["value"],
-        }
-        for opt in value_options
-    ]
+    options = [{"text": _plain_text(opt["label"]), "value": opt["value"]} for opt in value_options]
 
     input_block["element"] = {
         "type": "multi_static_select",
@@ -208,8 +208,9 @@ def build_multiselect_field(
     }
 
     if draft_value and isinstance(draft_value, list) and options:
+        selected_values = set(draft_value)
         input_block["element"]["initial_options"] = [
-            opt for opt in options if opt["value"] in draft_value
+            opt for opt in options if opt["value"] in selected_values
         ]
 
     return input_block
@@ -224,24 +225,27 @@ def _create_input_block(field: FormFieldTD, field_config: FormFieldConfigTD) ->
     return {
         "type": "input",
         "block_id": f"field_{field_path}",
-        "label": {"type": "plain_text", "text": label_text},
+        "label": _plain_text(label_text),
         "optional": not is_required,
     }
 
 
-# Field type dispatcher
-FIELD_BUILDERS = {
-    "String": build_text_field,
-    "Phone": build_text_field,
-    "Email": build_email_field,
-    "RichText": build_richtext_field,
-    "Number": build_number_field,
-    "Date": build_date_field,
-    "Boolean": build_boolean_field,
-    "Score": build_score_field,
-    "ValueSelect": build_select_field,
-    "MultiValueSelect": build_multiselect_field,
-}
+# Field type dispatcher (read-only; cached blocks assume builders never change)
+FIELD_BUILDERS: Mapping[str, FieldBuilder] = MappingProxyType(
+    {
+        "String": build_text_field,
+        "Phone": build_text_field,
+        "Email": build_email_field,
+        "RichText": build_richtext_field,
+        "Number": build_number_field,
+        "Date": build_date_field,
+        "Boolean": build_boolean_field,
+        "Score": build_score_field,
+        "ValueSelect": build_select_field,
+        "MultiValueSelect": build_multiselect_field,
+    }
+)
+_get_builder = FIELD_BUILDERS.get
 
 
 def build_input_block_from_field(
@@ -270,7 +274,7 @@ def build_input_block_from_field(
         Slack input block dict or None if unsupported field type
     """
     field_type = field["type"]
-    builder = FIELD_BUILDERS.get(field_type)
+    builder = _get_builder(field_type)
 
     if not builder:
         logger.warning("unsupported_field_type", field_type=field_type, path=field["path"])
@@ -2,33 +2,113 @@
 
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import Callable, Collection, Iterator
+from typing import Any, cast
 
 from app.types.ashby import FeedbackFormTD, FieldSubmissionTD
 from app.types.slack import FormValuesDictTD
 
+ActionData = dict[str, Any]
 
-def build_field_type_map(form_definition: FeedbackFormTD) -> dict[str, str]:
+
+def build_field_type_map(
+    form_definition: FeedbackFormTD, only_paths: Collection[str] | None = None
+) -> dict[str, str]:
     """
     Build a map of field_path → field_type from form definition.
 
     Args:
         form_definition: Ashby form definition
+        only_paths: If given, only map these paths and stop once all are found
 
     Returns:
         Dict mapping field paths to their types (e.g., {"feedback": "RichText"})
     """
-    field_type_map = {}
+    field_type_map: dict[str, str] = {}
     form_def = form_definition.get("formDefinition", form_definition)
+    remaining = len(only_paths) if only_paths is not None else -1
 
     for section in form_def.get("sections", []):
         for field_config in section.get("fields", []):
             field = field_config["field"]
-            field_type_map[field["path"]] = field["type"]
+            path = field["path"]
+            if only_paths is not None:
+                if path not in only_paths or path in field_type_map:
+                    continue
+                remaining -= 1
+            field_type_map[path] = field["type"]
+            if remaining == 0:
+                return field_type_map
 
     return field_type_map
 
 
+def _text_value(action_data: ActionData) -> Any:
+    return action_data.get("value")
+
+
+def _selected_date(action_data: ActionData) -> Any:
+    return action_data.get("selected_date")  # YYYY-MM-DD format
+
+
+def _is_checked(action_data: ActionData) -> bool:
+    return bool(action_data.get("selected_options"))
+
+
+def _selected_value(action_data: ActionData) -> Any:
+    selected = action_data.get("selected_option")
+    return selected["value"] if selected else None
+
+
+def _selected_values(action_data: ActionData) -> list[Any]:
+    return [opt["value"] for opt in action_data.get("selected_options", [])]
+
+
+# Slack action type → draft value extractor
+_DRAFT_EXTRACTORS: dict[str, Callable[[ActionData], Any]] = {
+    "plain_text_input": _text_value,
+    "email_text_input": _text_value,
+    "number_input": _text_value,
+    "datepicker": _selected_date,
+    "checkboxes": _is_checked,
+    "static_select": _selected_value,
+    "multi_static_select": _selected_values,
+}
+
+
+def _ashby_text(action_data: ActionData, field_type: str | None) -> Any:
+    value = action_data.get("value")
+    # Use actual field type instead of guessing
+    if value and field_type == "RichText":
+        return {"type": "PlainText", "value": value}
+    return value
+
+
+def _ashby_number(action_data: ActionData, field_type: str | None) -> int | None:
+    raw_value = action_data.get("value")
+    return int(raw_value) if raw_value else None
+
+
+def _ashby_select(action_data: ActionData, field_type: str | None) -> Any:
+    value = _selected_value(action_data)
+    # Use actual field type instead of guessing
+    if value is not None and field_type == "Score":
+        return {"score": int(value)}
+    return value
+
+
+# Slack action type → Ashby value extractor (takes the Ashby field type)
+_ASHBY_EXTRACTORS: dict[str, Callable[[ActionData, str | None], Any]] = {
+    "plain_text_input": _ashby_text,
+    "email_text_input": lambda action_data, _: _text_value(action_data),
+    "number_input": _ashby_number,
+    "datepicker": lambda action_data, _: _selected_date(action_data),
+    "checkboxes": lambda action_data, _: _is_checked(action_data),
+    "static_select": _ashby_select,
+    "multi_static_select": lambda action_data, _: _selected_values(action_data),
+}
+
+
 def extract_form_values(state_values: dict[str, Any]) -> FormValuesDictTD:
     """
     Extract all form values from Slack modal state for draft saving.
@@ -41,43 +121,29 @@ def extract_form_values(state_values: dict[str, Any]) -> FormValuesDictTD:
     Returns:
         Dict of field_path → value mappings
     """
-    form_values: FormValuesDictTD = {}
+    return cast(FormValuesDictTD, dict(_iter_form_values(state_values)))
+
 
+def _iter_form_values(state_values: dict[str, Any]) -> Iterator[tuple[str, Any]]:
+    """Yield (field_path, draft value) pairs for each field block in modal state."""
     for block_id, actions in state_values.items():
-        if not block_id.startswith("field_"):
+        field_path = block_id.removeprefix("field_")
+        if field_path is block_id:
             continue
 
-        field_path = block_id.replace("field_", "")
-        _, action_data = next(iter(actions.items()))
+        action_data = next(iter(actions.values()))
         action_type = action_data["type"]
 
-        # Extract value based on type
-        if action_type == "plain_text_input":
-            form_values[field_path] = action_data.get("value")
-
-        elif action_type == "email_text_input":
-            form_values[field_path] = action_data.get("value")
-
-        elif action_type == "number_input":
-            form_values[field_path] = action_data.get("value")
-
-        elif action_type == "datepicker":
-            form_values[field_path] = action_data.get("selected_date")
-
-        elif action_type == "checkboxes":
-            selected = action_data.get("selected_options", [])
-            form_values[field_path] = len(selected) > 0
-
-        elif action_type == "static_select":
-            selected = action_data.get("selected_option")
-            if selected:
-                form_values[field_path] = selected["value"]
+        extractor = _DRAFT_EXTRACTORS.get(action_type)
+        if extractor is None:
+            continue
 
-        elif action_type == "multi_static_select":
-            selected_options = action_data.get("selected_options", [])
-            form_values[field_path] = [opt["value"] for opt in selected_options]
+        value = extractor(action_data)
+        # Unselected single selects are left out of the draft entirely
+        if value is None and action_type == "static_select":
+            continue
 
-    return form_values
+        yield field_path, value
 
 
 def extract_field_submissions_for_ashby(
@@ -96,58 +162,32 @@ def extract_field_submissions_for_ashby(
     Returns:
         List of field submissions for Ashby API
     """
-    field_submissions: list[FieldSubmissionTD] = []
-
-    # Build field type lookup map
-    field_type_map = build_field_type_map(form_definition)
-
+    # Only resolve types for fields that were actually submitted
+    needed_paths = {
+        block_id.removeprefix("field_")
+        for block_id in state_values
+        if block_id.startswith("field_")
+    }
+    field_type_map = build_field_type_map(form_definition, needed_paths)
+
+    # Only add if value is not None
+    return [
+        {"path": field_path, "value": value}
+        for field_path, value in _iter_ashby_values(state_values, field_type_map)
+        if value is not None
+    ]
+
+
+def _iter_ashby_values(
+    state_values: dict[str, Any], field_type_map: dict[str, str]
+) -> Iterator[tuple[str, Any]]:
+    """Yield (field_path, Ashby value) pairs for each field block in modal state."""
     for block_id, actions in state_values.items():
-        if not block_id.startswith("field_"):
+        field_path = block_id.removeprefix("field_")
+        if field_path is block_id:
             continue
 
-        field_path = block_id.replace("field_", "")
-        field_type = field_type_map.get(field_path)  # Get actual type
-
-        _, action_data = next(iter(actions.items()))
-        action_type = action_data["type"]
-
-        value = None
-
-        if action_type == "plain_text_input":
-            value = action_data.get("value")
-            # Use actual field type instead of guessing
-            if value and field_type == "RichText":
-                value = {"type": "PlainText", "value": value}
-
-        elif action_type == "email_text_input":
-            value = action_data.get("value")
-
-        elif action_type == "number_input":
-            raw_value = action_data.get("value")
-            value = int(raw_value) if raw_value else None
-
-        elif action_type == "datepicker":
-            value = action_data.get("selected_date")  # YYYY-MM-DD format
-
-        elif action_type == "checkboxes":
-            selected = action_data.get("selected_options", [])
-            value = len(selected) > 0  # Boolean
-
-        elif action_type == "static_select":
-            selected = action_data.get("selected_option")
-            if selected:
-                # Use actual field type instead of guessing
-                if field_type == "Score":
-                    value = {"score": int(selected["value"])}
-                else:
-                    value = selected["value"]
-
-        elif action_type == "multi_static_select":
-            selected_options = action_data.get("selected_options", [])
-            value = [opt["value"] for opt in selected_options]
-
-        # Only add if value is not None
-        if value is not None:
-            field_submissions.append({"path": field_path, "value": value})
-
-    return field_submissions
+        action_data = next(iter(actions.values()))
+        extractor = _ASHBY_EXTRACTORS.get(action_data["type"])
+        if extractor is not None:
+            yield field_path, extractor(action_data, field_type_map.get(field_path))
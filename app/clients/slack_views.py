@@ -2,24 +2,51 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any
 
+import orjson
 from structlog import get_logger
 
 from app.clients.slack_field_builders import build_input_block_from_field
-from app.types.ashby import CandidateTD, FeedbackFormTD
+from app.types.ashby import CandidateTD, FeedbackFormTD, FormFieldConfigTD, FormFieldTD
 from app.types.slack import FormValuesDictTD, InterviewDataTD
 from app.utils.time import format_slack_timestamp
 
 logger = get_logger()
 
+_dumps = orjson.dumps
+
+# Shared default for optional nested lookups (never mutated)
+_EMPTY: dict[str, Any] = {}
+
+# Constant blocks shared by every modal/reminder (Slack only reads them)
+_DIVIDER_BLOCK: dict[str, Any] = {"type": "divider"}
+_DRAFT_SAVED_BLOCK: dict[str, Any] = {
+    "type": "context",
+    "elements": [{"type": "mrkdwn", "text": "💾 _Draft auto-saved previously_"}],
+}
+_DRAFT_TIP_BLOCK: dict[str, Any] = {
+    "type": "context",
+    "elements": [
+        {"type": "mrkdwn", "text": "_💾 Tip: Press Enter to save your progress as you work_"}
+    ],
+}
+_REMINDER_HEADER_BLOCK: dict[str, Any] = {
+    "type": "header",
+    "text": {"type": "plain_text", "text": "📋 Interview Feedback Reminder"},
+}
+
+# Pre-rendered form blocks (form_definition_id → (definition fingerprint, skeleton))
+FORM_SKELETON_CACHE_MAX_SIZE = 128
+_SkeletonEntry = tuple[dict[str, Any], FormFieldTD | None, FormFieldConfigTD | None]
+_form_skeleton_cache: dict[str, tuple[bytes, tuple[_SkeletonEntry, ...]]] = {}
+
 
 def truncate_text(text: str, max_length: int = 200) -> str:
     """Truncate text to max_length with ellipsis if needed."""
     if not text or len(text) <= max_length:
         return text
-    return text[:max_length].rsplit(" ", 1)[0] + "..."
+    return f"{text[:max_length].rsplit(' ', 1)[0]}..."
 
 
 def validate_message_length(blocks: list[dict[str, Any]]) -> list[dict[str, Any]]:
@@ -32,7 +59,8 @@ def validate_message_length(blocks: list[dict[str, Any]]) -> list[dict[str, Any]
     Returns:
         Validated blocks (truncated if needed)
     """
-    message_size = len(json.dumps(blocks))
+    # Block count says nothing about text length, so always measure (orjson is cheap)
+    message_size = len(_dumps(blocks))
 
     if message_size > 35000:  # Leave 5KB buffer
         logger.warning("message_too_large", size=message_size)
@@ -42,6 +70,66 @@ def validate_message_length(blocks: list[dict[str, Any]]) -> list[dict[str, Any]
     return blocks
 
 
+def _get_form_skeleton(form_definition: FeedbackFormTD) -> tuple[_SkeletonEntry, ...]:
+    """
+    Get the section header and input blocks for a form, without draft values.
+
+    Cached by form id and a fingerprint of the definition's content, so a
+    changed definition is rebuilt even if it arrives before the cache is cleared.
+
+    Args:
+        form_definition: Ashby form definition structure
+
+    Returns:
+        Tuple of (block, field, field_config); field is None for section headers
+    """
+    form_id = form_definition.get("id")
+    fingerprint = _dumps(form_definition, option=orjson.OPT_SORT_KEYS) if form_id else b""
+    cached = _form_skeleton_cache.get(form_id) if form_id else None
+    if cached and cached[0] == fingerprint:
+        return cached[1]
+
+    # Extract the actual form definition structure
+    # Ashby API returns: {id, title, formDefinition: {sections: [...]}}
+    form_def = form_definition.get("formDefinition", form_definition)
+
+    entries: list[_SkeletonEntry] = []
+    for section in form_def.get("sections", []):
+        # Section header (if present)
+        if section.get("title"):
+            entries.append(
+                (
+                    {
+                        "type": "section",
+                        "text": {"type": "mrkdwn", "text": f"*{section['title']}*"},
+                    },
+                    None,
+                    None,
+                )
+            )
+
+        # Add input blocks for each field
+        for field_config in section.get("fields", []):
+            field = field_config["field"]
+            input_block = build_input_block_from_field(field, field_config)
+            if input_block:
+                entries.append((input_block, field, field_config))
+
+    skeleton = tuple(entries)
+    if form_id:
+        _form_skeleton_cache.pop(form_id, None)
+        if len(_form_skeleton_cache) >= FORM_SKELETON_CACHE_MAX_SIZE:
+            _form_skeleton_cache.pop(next(iter(_form_skeleton_cache)))
+        _form_skeleton_cache[form_id] = (fingerprint, skeleton)
+
+    return skeleton
+
+
+def clear_form_skeleton_cache() -> None:
+    """Drop all cached form skeletons."""
+    _form_skeleton_cache.clear()
+
+
 async def build_feedback_modal(
     form_definition: FeedbackFormTD,
     candidate_data: CandidateTD,
@@ -128,54 +216,21 @@ async def build_feedback_modal(
             }
         )
 
-    blocks.append({"type": "divider"})  # Separate header from form
+    blocks.append(_DIVIDER_BLOCK)  # Separate header from form
 
-    # Extract the actual form definition structure
-    # Ashby API returns: {id, title, formDefinition: {sections: [...]}}
-    form_def = form_definition.get("formDefinition", form_definition)
-
-    # Build dynamic input blocks from form definition
-    for section in form_def.get("sections", []):
-        # Section header (if present)
-        if section.get("title"):
-            blocks.append(
-                {
-                    "type": "section",
-                    "text": {"type": "mrkdwn", "text": f"*{section['title']}*"},
-                }
-            )
-
-        # Add input blocks for each field
-        for field_config in section.get("fields", []):
-            field = field_config["field"]
-            input_block = build_input_block_from_field(
-                field, field_config, draft_values.get(field["path"])
-            )
-            if input_block:
-                blocks.append(input_block)
+    # Dynamic input blocks from the (cached) form skeleton, overlaying drafts
+    for block, field, field_config in _get_form_skeleton(form_definition):
+        draft_value = draft_values.get(field["path"]) if field else None
+        if field and field_config and draft_value:
+            block = build_input_block_from_field(field, field_config, draft_value) or block
+        else:
+            block = dict(block)
+        blocks.append(block)
 
     # Draft info
-    blocks.append({"type": "divider"})
+    blocks.append(_DIVIDER_BLOCK)
 
-    if draft_values:
-        blocks.append(
-            {
-                "type": "context",
-                "elements": [{"type": "mrkdwn", "text": "💾 _Draft auto-saved previously_"}],
-            }
-        )
-    else:
-        blocks.append(
-            {
-                "type": "context",
-                "elements": [
-                    {
-                        "type": "mrkdwn",
-                        "text": "_💾 Tip: Press Enter to save your progress as you work_",
-                    }
-                ],
-            }
-        )
+    blocks.append(_DRAFT_SAVED_BLOCK if draft_values else _DRAFT_TIP_BLOCK)
 
     # Build modal view
     event_id = interview_data.get("event_id", "")
@@ -187,7 +242,7 @@ async def build_feedback_modal(
         "type": "modal",
         "callback_id": "submit_feedback",
         "notify_on_close": True,
-        "private_metadata": json.dumps(
+        "private_metadata": _dumps(
             {
                 "event_id": event_id,
                 "form_definition_id": form_definition_id,
@@ -195,7 +250,7 @@ async def build_feedback_modal(
                 "interviewer_id": interviewer_id,
                 "candidate_id": candidate_data.get("id", ""),
             }
-        ),
+        ).decode(),
         "title": {"type": "plain_text", "text": "Interview Feedback"},
         "submit": {"type": "plain_text", "text": "Submit Feedback"},
         "close": {"type": "plain_text", "text": "Cancel"},
@@ -226,38 +281,33 @@ def build_reminder_message(
     blocks = []
 
     # Section 1: Header
-    blocks.append(
-        {
-            "type": "header",
-            "text": {"type": "plain_text", "text": "📋 Interview Feedback Reminder"},
-        }
-    )
+    blocks.append(_REMINDER_HEADER_BLOCK)
 
     # Section 2: Candidate Information
     candidate_name = candidate_data.get("name", "Candidate")
-    primary_email = candidate_data.get("primaryEmailAddress", {}).get("value", "")
-    primary_phone = candidate_data.get("primaryPhoneNumber", {}).get("value", "")
-    location = candidate_data.get("location", {}).get("locationSummary", "")
+    primary_email = candidate_data.get("primaryEmailAddress", _EMPTY).get("value", "")
+    primary_phone = candidate_data.get("primaryPhoneNumber", _EMPTY).get("value", "")
+    location = candidate_data.get("location", _EMPTY).get("locationSummary", "")
     timezone = candidate_data.get("timezone", "")
     position = candidate_data.get("position", "")
     company = candidate_data.get("company", "")
     school = candidate_data.get("school", "")
 
-    info_text = f"*{candidate_name}*\n"
+    info_parts = [f"*{candidate_name}*\n"]
     if primary_email:
-        info_text += f"📧 {primary_email}\n"
+        info_parts.append(f"📧 {primary_email}\n")
     if primary_phone:
-        info_text += f"📱 {primary_phone}\n"
+        info_parts.append(f"📱 {primary_phone}\n")
     if position and company:
-        info_text += f"💼 {position} at {company}\n"
+        info_parts.append(f"💼 {position} at {company}\n")
     if school:
-        info_text += f"🎓 {school}\n"
+        info_parts.append(f"🎓 {school}\n")
     if location:
-        info_text += f"📍 {location}"
+        info_parts.append(f"📍 {location}")
     if timezone:
-        info_text += f" • {timezone}"
+        info_parts.append(f" • {timezone}")
 
-    blocks.append({"type": "section", "text": {"type": "mrkdwn", "text": info_text}})
+    blocks.append({"type": "section", "text": {"type": "mrkdwn", "text": "".join(info_parts)}})
 
     # Section 3: Social Links
     links = []
@@ -292,7 +342,7 @@ def build_reminder_message(
         )
 
     # Section 5: Interview Details
-    blocks.append({"type": "divider"})
+    blocks.append(_DIVIDER_BLOCK)
 
     # Calculate duration
     start_time = interview_data["start_time"]
@@ -304,25 +354,25 @@ def build_reminder_message(
 
     # Build interview details
     interview_title = interview_data.get("interview_title", "Interview")
-    interview_text = f"*📅 {interview_title}*\n"
+    interview_parts = [f"*📅 {interview_title}*\n"]
 
     if job_title:
-        interview_text += f"Position: {job_title}\n"
+        interview_parts.append(f"Position: {job_title}\n")
 
-    interview_text += f"Start: {format_slack_timestamp(start_time)}\n"
+    interview_parts.append(f"Start: {format_slack_timestamp(start_time)}\n")
 
     if end_time:
-        interview_text += f"End: {format_slack_timestamp(end_time)}{duration_text}\n"
+        interview_parts.append(f"End: {format_slack_timestamp(end_time)}{duration_text}\n")
 
     location_str = interview_data.get("location")
     if location_str:
-        interview_text += f"📍 {location_str}\n"
+        interview_parts.append(f"📍 {location_str}\n")
 
     meeting_link = interview_data.get("meeting_link")
     if meeting_link:
-        interview_text += f"🔗 <{meeting_link}|Join Meeting>"
+        interview_parts.append(f"🔗 <{meeting_link}|Join Meeting>")
 
-    blocks.append({"type": "section", "text": {"type": "mrkdwn", "text": interview_text}})
+    blocks.append({"type": "section", "text": {"type": "mrkdwn", "text": "".join(interview_parts)}})
 
     # Section 6: Interview Instructions
     instructions = interview_data.get("instructions_plain")
@@ -337,8 +387,9 @@ def build_reminder_message(
             }
         )
 
-        # If instructions were truncated, add note
-        if len(instructions) > 200:
+        # If instructions were truncated, add note (truncate_text returns the
+        # original object when it fits)
+        if truncated is not instructions:
             blocks.append(
                 {
                     "type": "context",
@@ -354,10 +405,10 @@ def build_reminder_message(
             )
 
     # Section 7: Action Button & Footer
-    blocks.append({"type": "divider"})
+    blocks.append(_DIVIDER_BLOCK)
 
     # Submit feedback button
-    button_value = json.dumps(
+    button_value = _dumps(
         {
             "event_id": str(interview_data["event_id"]),
             "form_definition_id": str(interview_data["form_definition_id"]),
@@ -365,7 +416,7 @@ def build_reminder_message(
             "interviewer_id": str(interview_data["interviewer_id"]),
             "candidate_id": str(candidate_data["id"]),
         }
-    )
+    ).decode()
 
     blocks.append(
         {
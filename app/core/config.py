@@ -1,13 +1,18 @@
 """Application configuration."""
 
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
     """Application configuration from environment variables."""
 
+    model_config = SettingsConfigDict(env_file=".env", frozen=True, extra="ignore")
+
     # Database
     database_url: str
+    db_pool_min_size: int = 5
+    db_pool_max_size: int = 25
+    db_statement_cache_size: int = 1024
 
     # Ashby
     ashby_webhook_secret: str
@@ -20,10 +25,5 @@ class Settings(BaseSettings):
     # Application
     log_level: str = "INFO"
 
-    class Config:
-        """Pydantic configuration."""
-
-        env_file = ".env"
-
 
 settings = Settings.model_validate({})
@@ -6,12 +6,44 @@ import asyncio
 from typing import Any
 
 import asyncpg
+import orjson
 from structlog import get_logger
 
 from app.core.config import settings
 
 logger = get_logger()
 
+# Binary jsonb wire format is a version byte followed by the JSON text
+_JSONB_VERSION = b"\x01"
+
+
+def _encode_jsonb(value: Any) -> bytes:
+    """Encode a jsonb parameter; bytes are taken as already-serialized JSON."""
+    if isinstance(value, bytes):
+        return _JSONB_VERSION + value
+    return _JSONB_VERSION + orjson.dumps(value)
+
+
+def _decode_jsonb(data: bytes) -> Any:
+    """Decode a jsonb column to Python objects."""
+    return orjson.loads(data[1:])
+
+
+async def init_connection(conn: asyncpg.Connection) -> None:
+    """
+    Per-connection setup: exchange jsonb as Python objects via orjson.
+
+    Args:
+        conn: Newly opened pool connection
+    """
+    await conn.set_type_codec(
+        "jsonb",
+        encoder=_encode_jsonb,
+        decoder=_decode_jsonb,
+        schema="pg_catalog",
+        format="binary",
+    )
+
 
 class Database:
     """Database connection pool manager."""
@@ -34,11 +66,20 @@ class Database:
             try:
                 self.pool = await asyncpg.create_pool(
                     settings.database_url,
-                    min_size=2,
-                    max_size=10,
+                    min_size=settings.db_pool_min_size,
+                    max_size=settings.db_pool_max_size,
                     command_timeout=60,
+                    statement_cache_size=settings.db_statement_cache_size,
+                    # Recycle backends that sat idle for 5 minutes
+                    max_inactive_connection_lifetime=300,
+                    init=init_connection,
+                )
+                logger.info(
+                    "database_connected",
+                    min_size=settings.db_pool_min_size,
+                    max_size=settings.db_pool_max_size,
+                    attempt=attempt,
                 )
-                logger.info("database_connected", min_size=2, max_size=10, attempt=attempt)
                 return
             except Exception as e:
                 logger.error("database_connection_failed", attempt=attempt, error=str(e))
@@ -48,6 +89,25 @@ class Database:
                 # Exponential backoff
                 await asyncio.sleep(2**attempt)
 
+    async def warmup(self) -> None:
+        """
+        Round-trip a trivial query on every min-size pool connection at once.
+
+        Surfaces broken connections at startup rather than on the first request.
+        """
+        pool = self.pool
+        if not pool:
+            raise RuntimeError("Database pool not initialized")
+
+        connections = pool.get_min_size()
+
+        async def ping() -> None:
+            async with pool.acquire() as conn:
+                await conn.fetchval("SELECT 1")
+
+        await asyncio.gather(*(ping() for _ in range(connections)))
+        logger.info("database_pool_warmed", connections=connections)
+
     async def disconnect(self) -> None:
         """Close pool on shutdown."""
         if self.pool:
@@ -58,29 +118,54 @@ class Database:
         """Execute a query."""
         if not self.pool:
             raise RuntimeError("Database pool not initialized")
+        return await self.pool.execute(query, *args)
+
+    async def executemany(
+        self, query: str, args: list[tuple[Any, ...]], *, synchronous_commit: bool = True
+    ) -> None:
+        """
+        Execute a query once per argument tuple in a single round-trip.
+
+        Pass synchronous_commit=False for writes that can be replayed (e.g. syncs)
+        to skip waiting for the WAL flush on commit. A crash may then lose the
+        last few batches.
+        """
+        if not self.pool:
+            raise RuntimeError("Database pool not initialized")
+        if synchronous_commit:
+            await self.pool.executemany(query, args)
+            return
+
         async with self.pool.acquire() as conn:
-            return await conn.execute(query, *args)
+            async with conn.transaction():
+                await conn.execute("SET LOCAL synchronous_commit = OFF")
+                await conn.executemany(query, args)
+
+    async def copy_records_to_table(
+        self, table_name: str, records: list[tuple[Any, ...]], columns: list[str]
+    ) -> str:
+        """Bulk-load rows into a table using COPY."""
+        if not self.pool:
+            raise RuntimeError("Database pool not initialized")
+        return await self.pool.copy_records_to_table(table_name, records=records, columns=columns)
 
     async def fetch(self, query: str, *args: Any) -> list[asyncpg.Record]:
         """Fetch multiple rows."""
         if not self.pool:
             raise RuntimeError("Database pool not initialized")
-        async with self.pool.acquire() as conn:
-            return await conn.fetch(query, *args)
+        return await self.pool.fetch(query, *args)
 
     async def fetchrow(self, query: str, *args: Any) -> asyncpg.Record | None:
         """Fetch a single row."""
         if not self.pool:
             raise RuntimeError("Database pool not initialized")
-        async with self.pool.acquire() as conn:
-            return await conn.fetchrow(query, *args)
+        return await self.pool.fetchrow(query, *args)
 
     async def fetchval(self, query: str, *args: Any) -> Any:
         """Fetch a single value."""
         if not self.pool:
             raise RuntimeError("Database pool not initialized")
-        async with self.pool.acquire() as conn:
-            return await conn.fetchval(query, *args)
+        return await self.pool.fetchval(query, *args)
 
 
 db = Database()
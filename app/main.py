@@ -1,10 +1,12 @@
 """FastAPI application entry point."""
 
+import asyncio
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from typing import Any
 
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 
@@ -12,8 +14,11 @@ from app.api.admin import router as admin_router
 from app.api.slack_interactions import router as slack_router
 from app.api.webhooks import limiter
 from app.api.webhooks import router as webhook_router
+from app.clients.ashby import ashby_client
+from app.clients.slack import slack_client
 from app.core.database import db
 from app.core.logging import logger, setup_logging
+from app.services.audit import webhook_audit
 from app.services.scheduler import setup_scheduler, shutdown_scheduler, start_scheduler
 from app.services.sync import sync_feedback_forms, sync_interviews, sync_slack_users
 
@@ -27,15 +32,20 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Startup
     logger.info("application_starting")
     await db.connect()
+    await db.warmup()
+    await ashby_client.connect()
+    await slack_client.connect()
+    webhook_audit.start()
     setup_scheduler()
     start_scheduler()
 
-    try:
-        await sync_feedback_forms()
-        await sync_interviews()
-        await sync_slack_users()
-    except Exception:
-        logger.exception("initial_sync_failed")
+    # The three syncs touch independent tables/APIs, so run them concurrently
+    results = await asyncio.gather(
+        sync_feedback_forms(), sync_interviews(), sync_slack_users(), return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            logger.error("initial_sync_failed", error=str(result), exc_info=result)
 
     logger.info("application_ready")
 
@@ -44,6 +54,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Shutdown
     logger.info("application_shutting_down")
     shutdown_scheduler()
+    await webhook_audit.stop()
+    await ashby_client.disconnect()
+    await slack_client.disconnect()
     await db.disconnect()
     logger.info("application_stopped")
 
@@ -54,6 +67,7 @@ app = FastAPI(
     description="Interview feedback reminders via Slack",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Add rate limiter to app state
@@ -0,0 +1,94 @@
+"""Webhook audit log writer that batches inserts off the request path."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from datetime import UTC, datetime
+from typing import Any
+
+from structlog import get_logger
+
+from app.core.database import db
+
+logger = get_logger()
+
+AUDIT_COLUMNS = ["schedule_id", "received_at", "action", "payload"]
+
+
+class WebhookAuditWriter:
+    """
+    Buffer webhook audit rows and flush them to the database in batches.
+
+    The webhook handler only appends to an in-memory buffer; a background
+    task sleeps until the first row arrives, then writes the batch
+    flush_interval seconds later or as soon as max_batch rows are pending.
+    """
+
+    def __init__(self, max_batch: int = 64, flush_interval: float = 0.05) -> None:
+        """Initialize writer with batch size and flush interval (seconds)."""
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self._buffer: list[tuple[Any, ...]] = []
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    def enqueue(self, schedule_id: str | None, action: str, payload: bytes) -> None:
+        """
+        Queue a webhook payload for the audit table.
+
+        Args:
+            schedule_id: Interview schedule UUID (if present)
+            action: Webhook action name
+            payload: Raw JSON body (stored as-is, without re-serializing)
+        """
+        self._buffer.append((schedule_id, datetime.now(UTC), action, payload))
+        # Wake the writer for the first row (starts the flush timer) and for a full batch
+        if len(self._buffer) == 1 or len(self._buffer) >= self.max_batch:
+            self._wakeup.set()
+
+    async def flush(self) -> None:
+        """Write all buffered rows in a single COPY."""
+        if not self._buffer:
+            return
+
+        rows, self._buffer = self._buffer, []
+        try:
+            # COPY streams the whole batch far cheaper than per-row INSERTs
+            await db.copy_records_to_table(
+                "ashby_webhook_payloads", records=rows, columns=AUDIT_COLUMNS
+            )
+        except Exception:
+            logger.exception("webhook_audit_flush_failed", count=len(rows))
+
+    async def _run(self) -> None:
+        """Flush buffered rows until cancelled."""
+        while True:
+            # Idle with no timeout until something is buffered
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            if len(self._buffer) < self.max_batch:
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+                self._wakeup.clear()
+            await self.flush()
+
+    def start(self) -> None:
+        """Start the background flush task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            logger.info("webhook_audit_writer_started")
+
+    async def stop(self) -> None:
+        """Stop the background task and flush anything still buffered."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self.flush()
+        logger.info("webhook_audit_writer_stopped")
+
+
+# Module singleton
+webhook_audit = WebhookAuditWriter()
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import json
+import time
 
 from structlog import get_logger
 
@@ -13,10 +13,45 @@ from app.types.slack import FormValuesDictTD
 
 logger = get_logger()
 
+# Short-lived cache of loaded drafts ((event_id, interviewer_id) → (expires_at, values)).
+# Every draft write drops its key and bumps the generation, so a load that raced a
+# write never caches the pre-write value.
+DRAFT_CACHE_TTL_SECONDS = 30
+DRAFT_CACHE_MAX_SIZE = 1024
+_draft_cache: dict[tuple[str, str], tuple[float, FormValuesDictTD]] = {}
+_draft_generation = 0
+
+
+def clear_draft_cache() -> None:
+    """Drop all cached drafts."""
+    _draft_cache.clear()
+
+
+def _get_cached_draft(key: tuple[str, str]) -> FormValuesDictTD | None:
+    """Return cached draft values if present and not expired."""
+    entry = _draft_cache.get(key)
+    if entry and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+
+def _cache_draft(key: tuple[str, str], form_values: FormValuesDictTD) -> None:
+    """Store draft values, evicting the oldest entry when full."""
+    if len(_draft_cache) >= DRAFT_CACHE_MAX_SIZE:
+        _draft_cache.pop(next(iter(_draft_cache)))
+    _draft_cache[key] = (time.monotonic() + DRAFT_CACHE_TTL_SECONDS, form_values)
+
+
+def _invalidate_draft(event_id: str, interviewer_id: str) -> None:
+    """Forget a cached draft after it was written or deleted."""
+    global _draft_generation
+    _draft_generation += 1
+    _draft_cache.pop((event_id, interviewer_id), None)
+
 
 async def load_draft(event_id: str, interviewer_id: str) -> FormValuesDictTD:
     """
-    Load feedback draft from database.
+    Load feedback draft from database (cached for a short TTL).
 
     Args:
         event_id: Interview event UUID
@@ -25,6 +60,12 @@ async def load_draft(event_id: str, interviewer_id: str) -> FormValuesDictTD:
     Returns:
         Dict of form values or empty dict if no draft exists
     """
+    key = (event_id, interviewer_id)
+    cached = _get_cached_draft(key)
+    if cached is not None:
+        return cached
+
+    generation = _draft_generation
     draft = await db.fetchrow(
         """
         SELECT form_values
@@ -35,11 +76,14 @@ async def load_draft(event_id: str, interviewer_id: str) -> FormValuesDictTD:
         interviewer_id,
     )
 
+    form_values: FormValuesDictTD = draft["form_values"] if draft else {}
     if draft:
         logger.info("draft_loaded", event_id=event_id, interviewer_id=interviewer_id)
-        return json.loads(draft["form_values"])
 
-    return {}
+    if generation == _draft_generation:
+        _cache_draft(key, form_values)
+
+    return form_values
 
 
 async def save_draft(event_id: str, interviewer_id: str, form_values: FormValuesDictTD) -> None:
@@ -67,8 +111,9 @@ async def save_draft(event_id: str, interviewer_id: str, form_values: FormValues
     """,
         event_id,
         interviewer_id,
-        json.dumps(form_values),
+        form_values,
     )
+    _invalidate_draft(event_id, interviewer_id)
 
     logger.info("draft_saved", event_id=event_id, interviewer_id=interviewer_id)
 
@@ -89,6 +134,7 @@ async def delete_draft(event_id: str, interviewer_id: str) -> None:
         event_id,
         interviewer_id,
     )
+    _invalidate_draft(event_id, interviewer_id)
 
     logger.info("draft_deleted", event_id=event_id, interviewer_id=interviewer_id)
 
@@ -105,8 +151,7 @@ async def submit_feedback(
 
     Steps:
     1. Submit feedback via Ashby API
-    2. Update feedback_reminders_sent.submitted_at
-    3. Delete draft (no longer needed)
+    2. Update feedback_reminders_sent.submitted_at and delete the draft (one statement)
 
     Args:
         event_id: Interview event UUID
@@ -137,18 +182,22 @@ async def submit_feedback(
         form_id=form_definition_id,
     )
 
-    # Mark as submitted in database
+    # Mark as submitted and delete the draft (no longer needed) in one statement -
+    # a single round-trip, and both changes commit or neither does
     await db.execute(
         """
-        UPDATE feedback_reminders_sent
-        SET submitted_at = NOW()
+        WITH submitted AS (
+            UPDATE feedback_reminders_sent
+            SET submitted_at = NOW()
+            WHERE event_id = $1 AND interviewer_id = $2
+        )
+        DELETE FROM feedback_drafts
         WHERE event_id = $1 AND interviewer_id = $2
     """,
         event_id,
         interviewer_id,
     )
+    _invalidate_draft(event_id, interviewer_id)
 
-    # Delete draft (no longer needed)
-    await delete_draft(event_id, interviewer_id)
-
+    logger.info("draft_deleted", event_id=event_id, interviewer_id=interviewer_id)
     logger.info("feedback_submission_complete", event_id=event_id)
@@ -2,15 +2,95 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import time
+from collections.abc import Iterable
 from typing import Any
 
 from structlog import get_logger
 
 from app.core.database import db
+from app.utils.time import parse_ashby_timestamp
 
 logger = get_logger()
 
+# interview.info responses (interview_id → (expires_at, interview)). Interview
+# definitions rarely change and sync_interviews refreshes the table twice a day.
+INTERVIEW_CACHE_TTL_SECONDS = 900
+INTERVIEW_CACHE_MAX_SIZE = 1024
+_interview_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+
+
+def clear_interview_cache() -> None:
+    """Drop all cached interview.info responses."""
+    _interview_cache.clear()
+
+
+UPSERT_INTERVIEW_SQL = """
+    INSERT INTO interviews
+    (interview_id, title, external_title, is_archived, is_debrief,
+     instructions_html, instructions_plain, job_id,
+     feedback_form_definition_id, updated_at)
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, NOW())
+    ON CONFLICT (interview_id) DO UPDATE SET
+        title = EXCLUDED.title,
+        external_title = EXCLUDED.external_title,
+        is_archived = EXCLUDED.is_archived,
+        is_debrief = EXCLUDED.is_debrief,
+        instructions_html = EXCLUDED.instructions_html,
+        instructions_plain = EXCLUDED.instructions_plain,
+        job_id = EXCLUDED.job_id,
+        feedback_form_definition_id = EXCLUDED.feedback_form_definition_id,
+        updated_at = NOW()
+"""
+
+# COPY column order for build_event_rows records
+_EVENT_COLUMNS = [
+    "event_id",
+    "schedule_id",
+    "interview_id",
+    "created_at",
+    "updated_at",
+    "start_time",
+    "end_time",
+    "feedback_link",
+    "location",
+    "meeting_link",
+    "has_submitted_feedback",
+    "extra_data",
+]
+_ASSIGNMENT_COLUMNS = [
+    "event_id",
+    "interviewer_id",
+    "first_name",
+    "last_name",
+    "email",
+    "global_role",
+    "training_role",
+    "is_enabled",
+    "manager_id",
+    "interviewer_pool_id",
+    "interviewer_pool_title",
+    "interviewer_pool_is_archived",
+    "training_path",
+    "interviewer_updated_at",
+]
+
+
+def interview_row(interview: dict[str, Any]) -> tuple[Any, ...]:
+    """Build UPSERT_INTERVIEW_SQL arguments from an Ashby interview object."""
+    return (
+        interview["id"],
+        interview.get("title"),
+        interview.get("externalTitle"),
+        interview.get("isArchived", False),
+        interview.get("isDebrief", False),
+        interview.get("instructionsHtml"),
+        interview.get("instructionsPlain"),
+        interview.get("jobId"),
+        interview.get("feedbackFormDefinitionId"),
+    )
+
 
 async def process_schedule_update(schedule: dict[str, Any]) -> None:
     """
@@ -79,6 +159,28 @@ async def upsert_schedule_with_events(
     if not db.pool:
         raise RuntimeError("Database pool not initialized")
 
+    # Resolve interview definitions before taking a connection - no HTTP while
+    # holding a pooled connection open in a transaction
+    interview_ids = {
+        interview_id
+        for event in schedule.get("interviewEvents", [])
+        if (interview_id := _event_interview_id(event))
+    }
+    if interview_ids:
+        # Rows refreshed within the last hour (by sync or an earlier webhook) are
+        # trusted as-is - only stale or unknown interviews hit the API
+        fresh = await db.fetch(
+            """
+            SELECT interview_id FROM interviews
+            WHERE interview_id = ANY($1::uuid[])
+              AND updated_at > NOW() - INTERVAL '1 hour'
+        """,
+            list(interview_ids),
+        )
+        interview_ids -= {str(row["interview_id"]) for row in fresh}
+    interviews = await fetch_interviews(interview_ids)
+    event_rows, assignment_rows = build_event_rows(schedule, schedule_id)
+
     async with db.pool.acquire() as conn:
         async with conn.transaction():
             # Upsert schedule
@@ -109,140 +211,159 @@ async def upsert_schedule_with_events(
                 schedule_id,
             )
 
-            # Insert events and assignments
-            for event in schedule.get("interviewEvents", []):
-                await insert_event_with_assignments(conn, event, schedule_id)
+            # Refresh interview definitions (events reference them by FK)
+            if interviews:
+                await conn.executemany(
+                    UPSERT_INTERVIEW_SQL, [interview_row(i) for i in interviews.values()]
+                )
+                logger.info("interviews_fetched_and_updated", count=len(interviews))
+
+            # Bulk-load events and assignments
+            if event_rows:
+                await conn.copy_records_to_table(
+                    "interview_events", records=event_rows, columns=_EVENT_COLUMNS
+                )
+            if assignment_rows:
+                await conn.copy_records_to_table(
+                    "interview_assignments",
+                    records=assignment_rows,
+                    columns=_ASSIGNMENT_COLUMNS,
+                )
 
     logger.info("schedule_updated", schedule_id=schedule_id, status=status)
 
 
-async def insert_event_with_assignments(conn: Any, event: dict[str, Any], schedule_id: str) -> None:
+def _event_interview_id(event: dict[str, Any]) -> str | None:
+    """Get interview_id (either from nested interview object or direct reference)."""
+    interview_id = event.get("interviewId")
+    if not interview_id and event.get("interview"):
+        interview_id = event["interview"]["id"]
+    return interview_id
+
+
+async def fetch_interviews(interview_ids: Iterable[str]) -> dict[str, dict[str, Any]]:
     """
-    Insert interview event and associated interviewer assignments.
+    Fetch interview definitions via API, concurrently and cached for a short TTL.
+
+    Failed lookups are logged and omitted from the result.
 
     Args:
-        conn: Database connection from transaction
-        event: Event data from webhook
-        schedule_id: Schedule UUID
+        interview_ids: Ashby interview UUIDs
+
+    Returns:
+        Dict of interview_id → interview definition
     """
-    event_id: str = event["id"]
+    now = time.monotonic()
+    interviews: dict[str, dict[str, Any]] = {}
+    misses: list[str] = []
+    for interview_id in set(interview_ids):
+        entry = _interview_cache.get(interview_id)
+        if entry and entry[0] > now:
+            interviews[interview_id] = entry[1]
+        else:
+            misses.append(interview_id)
 
-    # Get interview_id (either from nested interview object or direct reference)
-    interview_id = event.get("interviewId")
-    if not interview_id and event.get("interview"):
-        interview_id = event["interview"]["id"]
+    results = await asyncio.gather(*(_fetch_interview(interview_id) for interview_id in misses))
 
-    if not interview_id:
-        logger.warning("event_missing_interview_id", event_id=event_id)
-        return
+    expires_at = time.monotonic() + INTERVIEW_CACHE_TTL_SECONDS
+    for interview_id, interview in zip(misses, results, strict=True):
+        if interview is None:
+            continue
+        interviews[interview_id] = interview
+        if len(_interview_cache) >= INTERVIEW_CACHE_MAX_SIZE:
+            _interview_cache.pop(next(iter(_interview_cache)))
+        _interview_cache[interview_id] = (expires_at, interview)
+
+    return interviews
 
-    # Fetch/update interview definition via API (ensures fresh data)
+
+async def _fetch_interview(interview_id: str) -> dict[str, Any] | None:
+    """Fetch one interview definition from Ashby, or None on failure."""
     # Import here to avoid circular dependency
     from app.clients.ashby import ashby_client
 
     try:
         response = await ashby_client.post("interview.info", {"id": interview_id})
-
-        if response["success"]:
-            interview: dict[str, Any] = response["results"]
-            await conn.execute(
-                """
-                INSERT INTO interviews
-                (interview_id, title, external_title, is_archived, is_debrief,
-                 instructions_html, instructions_plain, job_id,
-                 feedback_form_definition_id, updated_at)
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, NOW())
-                ON CONFLICT (interview_id) DO UPDATE SET
-                    title = EXCLUDED.title,
-                    external_title = EXCLUDED.external_title,
-                    is_archived = EXCLUDED.is_archived,
-                    is_debrief = EXCLUDED.is_debrief,
-                    instructions_html = EXCLUDED.instructions_html,
-                    instructions_plain = EXCLUDED.instructions_plain,
-                    job_id = EXCLUDED.job_id,
-                    feedback_form_definition_id = EXCLUDED.feedback_form_definition_id,
-                    updated_at = NOW()
-            """,
-                interview["id"],
-                interview.get("title"),
-                interview.get("externalTitle"),
-                interview.get("isArchived", False),
-                interview.get("isDebrief", False),
-                interview.get("instructionsHtml"),
-                interview.get("instructionsPlain"),
-                interview.get("jobId"),
-                interview.get("feedbackFormDefinitionId"),
-            )
-            logger.info("interview_fetched_and_updated", interview_id=interview_id)
-        else:
-            logger.warning(
-                "interview_fetch_failed",
-                interview_id=interview_id,
-                error=response.get("error"),
-            )
-
     except Exception:
         logger.exception("interview_fetch_error", interview_id=interview_id)
+        return None
 
-    # Insert event
-    await conn.execute(
-        """
-        INSERT INTO interview_events
-        (event_id, schedule_id, interview_id, created_at, updated_at,
-         start_time, end_time, feedback_link, location, meeting_link,
-         has_submitted_feedback, extra_data)
-        VALUES (
-            $1, $2, $3,
-            $4::text::timestamptz,
-            $5::text::timestamptz,
-            $6::text::timestamptz,
-            $7::text::timestamptz,
-            $8, $9, $10, $11, $12
+    if not response["success"]:
+        logger.warning(
+            "interview_fetch_failed",
+            interview_id=interview_id,
+            error=response.get("error"),
         )
-    """,
-        event_id,
-        schedule_id,
-        interview_id,
-        event.get("createdAt"),
-        event.get("updatedAt"),
-        event.get("startTime"),
-        event.get("endTime"),
-        event.get("feedbackLink"),
-        event.get("location"),
-        event.get("meetingLink"),
-        event.get("hasSubmittedFeedback", False),
-        json.dumps(event.get("extraData", {})),
-    )
+        return None
 
-    # Insert interviewer assignments
-    for interviewer in event.get("interviewers", []):
-        # Extract nested interviewer pool data
-        interviewer_pool = interviewer.get("interviewerPool", {})
+    interview: dict[str, Any] = response["results"]
+    return interview
 
-        await conn.execute(
-            """
-            INSERT INTO interview_assignments
-            (event_id, interviewer_id, first_name, last_name, email,
-             global_role, training_role, is_enabled, manager_id,
-             interviewer_pool_id, interviewer_pool_title,
-             interviewer_pool_is_archived, training_path, interviewer_updated_at)
-            VALUES (
-                $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13,
-                $14::text::timestamptz
+
+def build_event_rows(
+    schedule: dict[str, Any], schedule_id: str
+) -> tuple[list[tuple[Any, ...]], list[tuple[Any, ...]]]:
+    """
+    Build interview_events and interview_assignments COPY records for a schedule.
+
+    Events without an interview_id are skipped along with their interviewers.
+
+    Args:
+        schedule: Schedule data from webhook
+        schedule_id: Schedule UUID
+
+    Returns:
+        Tuple of (event records, assignment records) in column order
+    """
+    event_rows: list[tuple[Any, ...]] = []
+    assignment_rows: list[tuple[Any, ...]] = []
+
+    for event in schedule.get("interviewEvents", []):
+        event_id: str = event["id"]
+
+        interview_id = _event_interview_id(event)
+        if not interview_id:
+            logger.warning("event_missing_interview_id", event_id=event_id)
+            continue
+
+        event_rows.append(
+            (
+                event_id,
+                schedule_id,
+                interview_id,
+                parse_ashby_timestamp(event.get("createdAt")),
+                parse_ashby_timestamp(event.get("updatedAt")),
+                parse_ashby_timestamp(event.get("startTime")),
+                parse_ashby_timestamp(event.get("endTime")),
+                event.get("feedbackLink"),
+                event.get("location"),
+                event.get("meetingLink"),
+                event.get("hasSubmittedFeedback", False),
+                event.get("extraData", {}),
             )
-        """,
-            event_id,
-            interviewer["id"],
-            interviewer.get("firstName"),
-            interviewer.get("lastName"),
-            interviewer.get("email"),
-            interviewer.get("globalRole"),
-            interviewer.get("trainingRole"),
-            interviewer.get("isEnabled", True),
-            interviewer.get("managerId"),
-            interviewer_pool.get("id"),
-            interviewer_pool.get("title"),
-            interviewer_pool.get("isArchived", False),
-            json.dumps(interviewer_pool.get("trainingPath", {})),
-            interviewer.get("updatedAt"),
         )
+
+        for interviewer in event.get("interviewers", []):
+            # Extract nested interviewer pool data
+            interviewer_pool = interviewer.get("interviewerPool", {})
+
+            assignment_rows.append(
+                (
+                    event_id,
+                    interviewer["id"],
+                    interviewer.get("firstName"),
+                    interviewer.get("lastName"),
+                    interviewer.get("email"),
+                    interviewer.get("globalRole"),
+                    interviewer.get("trainingRole"),
+                    interviewer.get("isEnabled", True),
+                    interviewer.get("managerId"),
+                    interviewer_pool.get("id"),
+                    interviewer_pool.get("title"),
+                    interviewer_pool.get("isArchived", False),
+                    interviewer_pool.get("trainingPath", {}),
+                    parse_ashby_timestamp(interviewer.get("updatedAt")),
+                )
+            )
+
+    return event_rows, assignment_rows
@@ -2,17 +2,38 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
 from typing import Any
 
+import asyncpg
 from structlog import get_logger
 
-from app.clients.ashby import fetch_candidate_info, fetch_resume_url
+from app.clients.ashby import fetch_candidate_info, fetch_candidates, fetch_resume_url
 from app.clients.slack import slack_client
 from app.clients.slack_views import build_reminder_message
 from app.core.database import db
+from app.types.ashby import CandidateTD
+from app.utils.locks import KeyedLocks
 
 logger = get_logger()
 
+# Reminders sent in parallel - overlaps Ashby/Slack round-trips while staying
+# well inside both APIs' rate limits
+REMINDER_CONCURRENCY = 10
+
+# Slack remote file registrations ((candidate_id, handle) → (expires_at, external_id)).
+# Ashby resume URLs are presigned, so registrations are only reused for an hour.
+RESUME_CACHE_TTL_SECONDS = 3600
+RESUME_CACHE_MAX_SIZE = 1024
+_resume_cache: dict[tuple[str, str], tuple[float, str]] = {}
+_resume_locks = KeyedLocks()
+
+
+def clear_resume_cache() -> None:
+    """Drop all cached resume registrations."""
+    _resume_cache.clear()
+
 
 async def send_feedback_reminders() -> None:
     """
@@ -22,13 +43,27 @@ async def send_feedback_reminders() -> None:
     Query logic:
     - Start time between NOW() + 4 minutes and NOW() + 20 minutes
     - Status = 'Scheduled'
-    - Not already sent (NOT EXISTS in feedback_reminders_sent)
+    - Not already sent (anti-join on feedback_reminders_sent primary key)
     - Has Slack user mapping (INNER JOIN slack_users)
 
     Wide window (4-20 min) ensures no interviews fall through the cracks
     with 5-min job intervals. Duplicates prevented by feedback_reminders_sent check.
     """
     try:
+        # Cheap start_time index probe - skip the 5-table join when nothing is upcoming
+        has_upcoming = await db.fetchval(
+            """
+            SELECT EXISTS (
+                SELECT 1 FROM interview_events
+                WHERE start_time BETWEEN NOW() + INTERVAL '4 minutes'
+                                     AND NOW() + INTERVAL '20 minutes'
+            )
+        """
+        )
+        if not has_upcoming:
+            logger.info("no_reminders_to_send")
+            return
+
         query = """
             SELECT
                 ie.event_id,
@@ -54,14 +89,13 @@ async def send_feedback_reminders() -> None:
             JOIN interviews i ON ie.interview_id = i.interview_id
             JOIN interview_schedules s ON ie.schedule_id = s.schedule_id
             JOIN slack_users su ON ia.email = su.email
+            LEFT JOIN feedback_reminders_sent frs
+                ON frs.event_id = ie.event_id
+               AND frs.interviewer_id = ia.interviewer_id
             WHERE ie.start_time BETWEEN NOW() + INTERVAL '4 minutes'
                                     AND NOW() + INTERVAL '20 minutes'
               AND s.status = 'Scheduled'
-              AND NOT EXISTS (
-                  SELECT 1 FROM feedback_reminders_sent frs
-                  WHERE frs.event_id = ie.event_id
-                    AND frs.interviewer_id = ia.interviewer_id
-              )
+              AND frs.event_id IS NULL
         """
 
         results = await db.fetch(query)
@@ -72,35 +106,56 @@ async def send_feedback_reminders() -> None:
 
         logger.info("processing_reminders", count=len(results))
 
-        for row in results:
-            try:
-                # Convert asyncpg.Record to plain dict
-                row_dict = {str(k): v for k, v in dict(row).items()}
-                await send_single_reminder(row_dict)
-            except Exception as e:
-                logger.error(
-                    "failed_to_send_single_reminder",
-                    event_id=row["event_id"],
-                    error=str(e),
-                )
+        # One candidate.info per candidate, not per interviewer row
+        candidates = await fetch_candidates(row["candidate_id"] for row in results)
+
+        semaphore = asyncio.Semaphore(REMINDER_CONCURRENCY)
+
+        async def send_bounded(row: asyncpg.Record) -> bool:
+            async with semaphore:
+                try:
+                    receipt = await send_single_reminder(row, candidates.get(row["candidate_id"]))
+                except Exception as e:
+                    logger.error(
+                        "failed_to_send_single_reminder",
+                        event_id=row["event_id"],
+                        error=str(e),
+                    )
+                    return False
+
+                # Record right away so a later failure can't cause this DM to be resent
+                await record_reminder_sent(receipt)
+                return True
 
-        logger.info("reminders_batch_complete", sent=len(results))
+        sent = sum(await asyncio.gather(*(send_bounded(row) for row in results)))
+
+        logger.info("reminders_batch_complete", sent=sent)
 
     except Exception:
         logger.exception("send_feedback_reminders_job_failed")
 
 
-async def send_single_reminder(row: dict[str, Any]) -> None:
+async def send_single_reminder(
+    row: asyncpg.Record, candidate_data: CandidateTD | None = None
+) -> tuple[Any, ...]:
     """
     Send a single feedback reminder DM.
 
+    The caller records the returned row with record_reminder_sent.
+
     Args:
-        row: Database row with interview and interviewer data
+        row: Reminder query record with interview and interviewer data
+        candidate_data: Prefetched candidate info (fetched here if not provided)
+
+    Returns:
+        feedback_reminders_sent row (event_id, interviewer_id, slack_user_id,
+        slack_channel_id, slack_message_ts)
     """
     event_id = row["event_id"]
 
     # Fetch candidate information
-    candidate_data = await fetch_candidate_info(row["candidate_id"])
+    if candidate_data is None:
+        candidate_data = await fetch_candidate_info(row["candidate_id"])
 
     # Fetch job title if available (with caching)
     from app.services.sync import sync_job_info
@@ -111,19 +166,14 @@ async def send_single_reminder(row: dict[str, Any]) -> None:
         if job_info:
             job_title = job_info.get("title")
 
-    # Fetch resume URL if available
-    resume_url = None
+    # Register resume with Slack if available (shared across a candidate's panel)
     file_external_id = None
     if candidate_data.get("resumeFileHandle"):
-        resume_url = await fetch_resume_url(candidate_data["resumeFileHandle"]["handle"])
-
-        # Register remote file with Slack
-        if resume_url:
-            file_external_id = await slack_client.register_remote_file(
-                external_id=f"resume_{row['candidate_id']}",
-                url=resume_url,
-                title=candidate_data["resumeFileHandle"]["name"],
-            )
+        file_external_id = await register_resume(
+            row["candidate_id"],
+            candidate_data["resumeFileHandle"]["handle"],
+            candidate_data["resumeFileHandle"]["name"],
+        )
 
     # Build comprehensive reminder message
     blocks = build_reminder_message(
@@ -152,14 +202,13 @@ async def send_single_reminder(row: dict[str, Any]) -> None:
         blocks=blocks,
     )
 
-    # Track reminder sent
-    await db.execute(
-        """
-        INSERT INTO feedback_reminders_sent
-        (event_id, interviewer_id, slack_user_id, slack_channel_id,
-         slack_message_ts, sent_at)
-        VALUES ($1, $2, $3, $4, $5, NOW())
-    """,
+    logger.info(
+        "feedback_reminder_sent",
+        event_id=event_id,
+        interviewer_id=row["interviewer_id"],
+    )
+
+    return (
         event_id,
         row["interviewer_id"],
         row["slack_user_id"],
@@ -167,8 +216,76 @@ async def send_single_reminder(row: dict[str, Any]) -> None:
         response["ts"],
     )
 
-    logger.info(
-        "feedback_reminder_sent",
-        event_id=event_id,
-        interviewer_id=row["interviewer_id"],
-    )
+
+async def record_reminder_sent(receipt: tuple[Any, ...]) -> None:
+    """
+    Track a sent reminder in feedback_reminders_sent.
+
+    Skips the row if its event was deleted (e.g. by a cancel webhook) or the
+    Slack user is gone, and ignores duplicates from an overlapping run. Errors
+    are logged, not raised, since the DM has already gone out.
+
+    Args:
+        receipt: Row returned by send_single_reminder
+    """
+    try:
+        await db.execute(
+            """
+            INSERT INTO feedback_reminders_sent
+            (event_id, interviewer_id, slack_user_id, slack_channel_id,
+             slack_message_ts, sent_at)
+            SELECT $1::uuid, $2::uuid, $3::text, $4::text, $5::text, NOW()
+            WHERE EXISTS (SELECT 1 FROM interview_events WHERE event_id = $1::uuid)
+              AND EXISTS (SELECT 1 FROM slack_users WHERE slack_user_id = $3::text)
+            ON CONFLICT (event_id, interviewer_id) DO NOTHING
+        """,
+            *receipt,
+        )
+    except Exception as e:
+        logger.error("failed_to_record_reminder_sent", event_id=receipt[0], error=str(e))
+
+
+async def register_resume(candidate_id: str, handle: str, title: str) -> str | None:
+    """
+    Fetch a candidate's resume URL and register it with Slack as a remote file.
+
+    Successful registrations are cached per (candidate_id, handle), so every
+    interviewer on a panel reuses one Ashby file.info and one Slack call.
+
+    Args:
+        candidate_id: Ashby candidate UUID
+        handle: Ashby resume file handle
+        title: Display title for the Slack file
+
+    Returns:
+        Slack file external_id, or None if the resume could not be registered
+    """
+    key = (candidate_id, handle)
+    entry = _resume_cache.get(key)
+    if entry and entry[0] > time.monotonic():
+        return entry[1]
+
+    async with _resume_locks.hold(key):
+        # Another reminder may have registered it while we waited
+        entry = _resume_cache.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+
+        resume_url = await fetch_resume_url(handle)
+        if not resume_url:
+            return None
+
+        file_external_id = await slack_client.register_remote_file(
+            external_id=f"resume_{candidate_id}",
+            url=resume_url,
+            title=title,
+        )
+        if file_external_id:
+            if len(_resume_cache) >= RESUME_CACHE_MAX_SIZE:
+                # Evict oldest entry (dicts preserve insertion order)
+                _resume_cache.pop(next(iter(_resume_cache)))
+            _resume_cache[key] = (
+                time.monotonic() + RESUME_CACHE_TTL_SECONDS,
+                file_external_id,
+            )
+        return file_external_id
@@ -13,6 +13,9 @@ logger = get_logger()
 # Create scheduler instance
 scheduler = AsyncIOScheduler()
 
+# Each sync run is delayed by a random 0-300s to spread Ashby/Slack/DB load
+SYNC_JITTER_SECONDS = 300
+
 
 def setup_scheduler() -> None:
     """
@@ -25,6 +28,7 @@ def setup_scheduler() -> None:
     - sync_slack_users: Every 12 hours
 
     All jobs use coalesce=True and max_instances=1 to prevent overlaps.
+    Sync jobs are jittered so the two 12-hour jobs don't fire together.
     """
     # Send interview reminders every 5 minutes
     scheduler.add_job(
@@ -46,6 +50,7 @@ def setup_scheduler() -> None:
         replace_existing=True,
         coalesce=True,
         max_instances=1,
+        jitter=SYNC_JITTER_SECONDS,
     )
 
     # Sync interview definitions every 12 hours
@@ -57,6 +62,7 @@ def setup_scheduler() -> None:
         replace_existing=True,
         coalesce=True,
         max_instances=1,
+        jitter=SYNC_JITTER_SECONDS,
     )
 
     # Sync Slack users every 12 hours
@@ -68,6 +74,7 @@ def setup_scheduler() -> None:
         replace_existing=True,
         coalesce=True,
         max_instances=1,
+        jitter=SYNC_JITTER_SECONDS,
     )
 
     logger.info("scheduler_configured", jobs=4)
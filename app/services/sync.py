@@ -2,127 +2,164 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import aclosing, suppress
+from datetime import UTC, datetime
 from typing import Any, cast
 
 from structlog import get_logger
 
 from app.clients.ashby import ashby_client
 from app.clients.slack import slack_client
+from app.clients.slack_views import clear_form_skeleton_cache
 from app.core.database import db
+from app.services.interviews import UPSERT_INTERVIEW_SQL, interview_row
 from app.types.ashby import FeedbackFormTD, JobInfoTD
+from app.utils.locks import KeyedLocks
 from app.utils.time import is_stale
 
 logger = get_logger()
 
+# In-process cache of form definitions (form_definition_id → (updated_at, form)).
+# Forms only change via sync, which clears this cache after writing.
+_form_def_cache: dict[str, tuple[datetime, FeedbackFormTD]] = {}
 
-async def sync_feedback_forms() -> None:
-    """
-    Sync all feedback form definitions from Ashby.
 
-    Runs on startup and every 6 hours via scheduler.
+def clear_form_definition_cache() -> None:
+    """Drop all cached feedback form definitions."""
+    _form_def_cache.clear()
+
+
+# users.list page size (Slack recommends no more than 200)
+SLACK_USERS_PAGE_SIZE = 200
+
+# In-process TTL cache for job.info (job_id → (expires_at, job or None)).
+# Job titles rarely change; failures are cached briefly to avoid hammering Ashby.
+JOB_CACHE_TTL_SECONDS = 3600
+JOB_CACHE_NEGATIVE_TTL_SECONDS = 60
+JOB_CACHE_MAX_SIZE = 1024
+_job_cache: dict[str, tuple[float, JobInfoTD | None]] = {}
+_job_locks = KeyedLocks()
+
+
+def clear_job_cache() -> None:
+    """Drop all cached job.info responses."""
+    _job_cache.clear()
+
+
+async def _ashby_pages(endpoint: str) -> AsyncIterator[dict[str, Any]]:
     """
-    logger.info("sync_feedback_forms_started")
+    Yield responses from a cursor-paginated Ashby list endpoint.
 
-    cursor: str | None = None
-    forms_synced = 0
+    The next page is requested before the current one is yielded, so the
+    caller's database writes overlap the API round-trip.
 
+    Args:
+        endpoint: Ashby list endpoint (e.g., "interview.list")
+
+    Yields:
+        Raw API response for each page
+    """
+    request = asyncio.create_task(ashby_client.post(endpoint, {"cursor": None, "limit": 100}))
     try:
         while True:
-            response = await ashby_client.post(
-                "feedbackFormDefinition.list", {"cursor": cursor, "limit": 100}
-            )
+            response = await request
+            more = response["success"] and response.get("moreDataAvailable")
+            if more:
+                request = asyncio.create_task(
+                    ashby_client.post(
+                        endpoint, {"cursor": response.get("nextCursor"), "limit": 100}
+                    )
+                )
+            yield response
+            if not more:
+                return
+    finally:
+        # Caller stopped early - drop the prefetch and retrieve its outcome so a
+        # failed request isn't reported as "Task exception was never retrieved"
+        request.cancel()
+        with suppress(asyncio.CancelledError, Exception):
+            await request
 
-            if not response["success"]:
-                logger.error("feedback_form_sync_failed", error=response.get("error"))
-                break
 
-            for form in response["results"]:
-                form_dict: dict[str, Any] = form
-                await db.execute(
-                    """
-                    INSERT INTO feedback_form_definitions
-                    (form_definition_id, title, definition, is_archived, updated_at)
-                    VALUES ($1, $2, $3, $4, NOW())
-                    ON CONFLICT (form_definition_id) DO UPDATE SET
-                        title = EXCLUDED.title,
-                        definition = EXCLUDED.definition,
-                        is_archived = EXCLUDED.is_archived,
-                        updated_at = NOW()
-                """,
-                    form_dict["id"],
-                    form_dict.get("title"),
-                    json.dumps(form_dict),
-                    form_dict.get("isArchived", False),
-                )
-                forms_synced += 1
+async def sync_feedback_forms() -> None:
+    """
+    Sync all feedback form definitions from Ashby.
 
-            if not response.get("moreDataAvailable"):
-                break
+    Runs on startup and every 6 hours via scheduler. Writes skip synchronous
+    commit - anything lost in a crash is re-fetched on the next run.
+    """
+    logger.info("sync_feedback_forms_started")
 
-            cursor = response.get("nextCursor")
+    forms_synced = 0
+
+    try:
+        async with aclosing(_ashby_pages("feedbackFormDefinition.list")) as pages:
+            async for response in pages:
+                if not response["success"]:
+                    logger.error("feedback_form_sync_failed", error=response.get("error"))
+                    break
+
+                forms: list[dict[str, Any]] = response["results"]
+                if forms:
+                    await db.executemany(
+                        """
+                        INSERT INTO feedback_form_definitions
+                        (form_definition_id, title, definition, is_archived, updated_at)
+                        VALUES ($1, $2, $3, $4, NOW())
+                        ON CONFLICT (form_definition_id) DO UPDATE SET
+                            title = EXCLUDED.title,
+                            definition = EXCLUDED.definition,
+                            is_archived = EXCLUDED.is_archived,
+                            updated_at = NOW()
+                    """,
+                        [
+                            (form["id"], form.get("title"), form, form.get("isArchived", False))
+                            for form in forms
+                        ],
+                        synchronous_commit=False,
+                    )
+                    forms_synced += len(forms)
 
         logger.info("sync_feedback_forms_completed", count=forms_synced)
 
     except Exception:
         logger.exception("sync_feedback_forms_error")
 
+    finally:
+        # Invalidate cached definitions - rows may have changed even on partial failure
+        clear_form_definition_cache()
+        clear_form_skeleton_cache()
+
 
 async def sync_interviews() -> None:
     """
     Sync all interview definitions from Ashby.
 
-    Runs on startup and every 12 hours via scheduler.
+    Runs on startup and every 12 hours via scheduler. Writes skip synchronous
+    commit - anything lost in a crash is re-fetched on the next run.
     """
     logger.info("sync_interviews_started")
 
-    cursor = None
     interviews_synced = 0
 
     try:
-        while True:
-            response = await ashby_client.post("interview.list", {"cursor": cursor, "limit": 100})
-
-            if not response["success"]:
-                logger.error("interview_sync_failed", error=response.get("error"))
-                break
-
-            for interview in response["results"]:
-                interview_dict: dict[str, Any] = interview
-                await db.execute(
-                    """
-                    INSERT INTO interviews
-                    (interview_id, title, external_title, is_archived, is_debrief,
-                     instructions_html, instructions_plain, job_id,
-                     feedback_form_definition_id, updated_at)
-                    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, NOW())
-                    ON CONFLICT (interview_id) DO UPDATE SET
-                        title = EXCLUDED.title,
-                        external_title = EXCLUDED.external_title,
-                        is_archived = EXCLUDED.is_archived,
-                        is_debrief = EXCLUDED.is_debrief,
-                        instructions_html = EXCLUDED.instructions_html,
-                        instructions_plain = EXCLUDED.instructions_plain,
-                        job_id = EXCLUDED.job_id,
-                        feedback_form_definition_id = EXCLUDED.feedback_form_definition_id,
-                        updated_at = NOW()
-                """,
-                    interview_dict["id"],
-                    interview_dict.get("title"),
-                    interview_dict.get("externalTitle"),
-                    interview_dict.get("isArchived", False),
-                    interview_dict.get("isDebrief", False),
-                    interview_dict.get("instructionsHtml"),
-                    interview_dict.get("instructionsPlain"),
-                    interview_dict.get("jobId"),
-                    interview_dict.get("feedbackFormDefinitionId"),
-                )
-                interviews_synced += 1
-
-            if not response.get("moreDataAvailable"):
-                break
-
-            cursor = response.get("nextCursor")
+        async with aclosing(_ashby_pages("interview.list")) as pages:
+            async for response in pages:
+                if not response["success"]:
+                    logger.error("interview_sync_failed", error=response.get("error"))
+                    break
+
+                interviews: list[dict[str, Any]] = response["results"]
+                if interviews:
+                    await db.executemany(
+                        UPSERT_INTERVIEW_SQL,
+                        [interview_row(interview) for interview in interviews],
+                        synchronous_commit=False,
+                    )
+                    interviews_synced += len(interviews)
 
         logger.info("sync_interviews_completed", count=interviews_synced)
 
@@ -134,7 +171,7 @@ async def get_feedback_form_definition(
     form_definition_id: str,
 ) -> FeedbackFormTD | None:
     """
-    Get feedback form from DB, refresh if stale (>24 hours).
+    Get feedback form from cache or DB, refresh if stale (>24 hours).
 
     Args:
         form_definition_id: Form definition UUID
@@ -142,6 +179,10 @@ async def get_feedback_form_definition(
     Returns:
         Form definition dict or None
     """
+    cached = _form_def_cache.get(form_definition_id)
+    if cached and not is_stale(cached[0], hours=24):
+        return cached[1]
+
     form = await db.fetchrow(
         """
         SELECT definition, updated_at
@@ -171,12 +212,18 @@ async def get_feedback_form_definition(
             """,
                 form_definition_id,
                 form_data.get("title"),
-                json.dumps(form_data),
+                form_data,
             )
 
+            _form_def_cache[form_definition_id] = (datetime.now(UTC), form_data)
             return form_data
 
-    return cast(FeedbackFormTD, json.loads(str(form["definition"]))) if form else None
+    if not form:
+        return None
+
+    form_def = cast(FeedbackFormTD, form["definition"])
+    _form_def_cache[form_definition_id] = (form["updated_at"], form_def)
+    return form_def
 
 
 async def fetch_and_update_interview(interview_id: str) -> None:
@@ -193,34 +240,7 @@ async def fetch_and_update_interview(interview_id: str) -> None:
 
         if response["success"]:
             interview: dict[str, Any] = response["results"]
-            await db.execute(
-                """
-                INSERT INTO interviews
-                (interview_id, title, external_title, is_archived, is_debrief,
-                 instructions_html, instructions_plain, job_id,
-                 feedback_form_definition_id, updated_at)
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, NOW())
-                ON CONFLICT (interview_id) DO UPDATE SET
-                    title = EXCLUDED.title,
-                    external_title = EXCLUDED.external_title,
-                    is_archived = EXCLUDED.is_archived,
-                    is_debrief = EXCLUDED.is_debrief,
-                    instructions_html = EXCLUDED.instructions_html,
-                    instructions_plain = EXCLUDED.instructions_plain,
-                    job_id = EXCLUDED.job_id,
-                    feedback_form_definition_id = EXCLUDED.feedback_form_definition_id,
-                    updated_at = NOW()
-            """,
-                interview["id"],
-                interview.get("title"),
-                interview.get("externalTitle"),
-                interview.get("isArchived", False),
-                interview.get("isDebrief", False),
-                interview.get("instructionsHtml"),
-                interview.get("instructionsPlain"),
-                interview.get("jobId"),
-                interview.get("feedbackFormDefinitionId"),
-            )
+            await db.execute(UPSERT_INTERVIEW_SQL, *interview_row(interview))
             logger.info("interview_fetched_and_updated", interview_id=interview_id)
         else:
             logger.warning(
@@ -235,10 +255,11 @@ async def fetch_and_update_interview(interview_id: str) -> None:
 
 async def sync_job_info(job_id: str) -> JobInfoTD | None:
     """
-    Fetch job information from Ashby API.
+    Fetch job information from Ashby API (cached in-process).
 
-    Used to get job title for display in messages. Could be cached in
-    a jobs table if performance becomes an issue, similar to interviews table.
+    Used to get job title for display in messages. Failed lookups are cached
+    briefly so a batch of reminders for the same job does not retry each time.
+    Concurrent misses for the same job share a single API call.
 
     Args:
         job_id: Ashby job UUID
@@ -246,6 +267,36 @@ async def sync_job_info(job_id: str) -> JobInfoTD | None:
     Returns:
         Job data dict or None if not found
     """
+    entry = _get_cached_job(job_id)
+    if entry is not None:
+        return entry[1]
+
+    async with _job_locks.hold(job_id):
+        # Another caller may have filled the cache while we waited
+        entry = _get_cached_job(job_id)
+        if entry is not None:
+            return entry[1]
+
+        job_info = await _fetch_job_info(job_id)
+
+        ttl = JOB_CACHE_TTL_SECONDS if job_info else JOB_CACHE_NEGATIVE_TTL_SECONDS
+        if len(_job_cache) >= JOB_CACHE_MAX_SIZE:
+            # Evict oldest entry (dicts preserve insertion order)
+            _job_cache.pop(next(iter(_job_cache)))
+        _job_cache[job_id] = (time.monotonic() + ttl, job_info)
+        return job_info
+
+
+def _get_cached_job(job_id: str) -> tuple[float, JobInfoTD | None] | None:
+    """Return the cache entry for a job if present and not expired."""
+    entry = _job_cache.get(job_id)
+    if entry and entry[0] > time.monotonic():
+        return entry
+    return None
+
+
+async def _fetch_job_info(job_id: str) -> JobInfoTD | None:
+    """Fetch job information from Ashby API, bypassing the cache."""
     try:
         response = await ashby_client.post("job.info", {"id": job_id})
         if response["success"]:
@@ -258,7 +309,8 @@ async def sync_job_info(job_id: str) -> JobInfoTD | None:
 async def sync_slack_users() -> None:
     """
     Sync all Slack users to enable email → slack_user_id mapping.
-    Runs on startup and every 12 hours via scheduler.
+    Runs on startup and every 12 hours via scheduler. Writes skip synchronous
+    commit - anything lost in a crash is re-fetched on the next run.
 
     Filters out:
     - Bots (is_bot=True)
@@ -267,46 +319,65 @@ async def sync_slack_users() -> None:
     """
     logger.info("sync_slack_users_started")
 
-    try:
-        response = await slack_client.client.users_list()
-
-        if not response["ok"]:
-            logger.error("slack_users_list_failed", error=response["error"])
-            return
+    users_synced = 0
+    cursor: str | None = None
 
-        users_synced = 0
-        users: list[dict[str, Any]] = response.get("members", [])
+    try:
+        while True:
+            response = await slack_client.client.users_list(
+                cursor=cursor, limit=SLACK_USERS_PAGE_SIZE
+            )
 
-        for user in users:
-            # Skip bots and deleted users
-            if user.get("is_bot") or user.get("deleted"):
-                continue
+            if not response["ok"]:
+                logger.error("slack_users_list_failed", error=response["error"])
+                return
+
+            users: list[dict[str, Any]] = response.get("members", [])
+            rows: list[tuple[Any, ...]] = []
+
+            for user in users:
+                # Skip bots and deleted users
+                if user.get("is_bot") or user.get("deleted"):
+                    continue
+
+                profile: dict[str, Any] = user.get("profile", {})
+                email = profile.get("email")
+                if not email:
+                    continue
+
+                rows.append(
+                    (
+                        user["id"],
+                        email,
+                        user.get("real_name"),
+                        profile.get("display_name"),
+                        user.get("is_bot", False),
+                        user.get("deleted", False),
+                    )
+                )
 
-            email = user.get("profile", {}).get("email")
-            if not email:
-                continue
+            if rows:
+                await db.executemany(
+                    """
+                    INSERT INTO slack_users
+                    (slack_user_id, email, real_name, display_name, is_bot, deleted, updated_at)
+                    VALUES ($1, $2, $3, $4, $5, $6, NOW())
+                    ON CONFLICT (slack_user_id) DO UPDATE SET
+                        email = EXCLUDED.email,
+                        real_name = EXCLUDED.real_name,
+                        display_name = EXCLUDED.display_name,
+                        is_bot = EXCLUDED.is_bot,
+                        deleted = EXCLUDED.deleted,
+                        updated_at = NOW()
+                """,
+                    rows,
+                    synchronous_commit=False,
+                )
+                users_synced += len(rows)
 
-            await db.execute(
-                """
-                INSERT INTO slack_users
-                (slack_user_id, email, real_name, display_name, is_bot, deleted, updated_at)
-                VALUES ($1, $2, $3, $4, $5, $6, NOW())
-                ON CONFLICT (slack_user_id) DO UPDATE SET
-                    email = EXCLUDED.email,
-                    real_name = EXCLUDED.real_name,
-                    display_name = EXCLUDED.display_name,
-                    is_bot = EXCLUDED.is_bot,
-                    deleted = EXCLUDED.deleted,
-                    updated_at = NOW()
-            """,
-                user["id"],
-                email,
-                user.get("real_name"),
-                user.get("profile", {}).get("display_name"),
-                user.get("is_bot", False),
-                user.get("deleted", False),
-            )
-            users_synced += 1
+            cursor = response.get("response_metadata", {}).get("next_cursor")
+            if not cursor:
+                break
 
         logger.info("sync_slack_users_completed", count=users_synced)
 
@@ -0,0 +1,40 @@
+"""Per-key asyncio locks for single-flight cache fills."""
+
+import asyncio
+from collections.abc import AsyncIterator, Hashable
+from contextlib import asynccontextmanager
+
+
+class KeyedLocks:
+    """
+    One asyncio.Lock per key, dropped once no task holds or waits on it.
+
+    Each entry counts its holder plus waiters, so a key's lock is removed only
+    when the last of them leaves. Popping it any earlier would hand the next
+    caller a fresh lock while tasks are still queued on the old one.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no keys tracked."""
+        self._locks: dict[Hashable, tuple[asyncio.Lock, int]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of keys currently held or awaited."""
+        return len(self._locks)
+
+    @asynccontextmanager
+    async def hold(self, key: Hashable) -> AsyncIterator[None]:
+        """Hold the lock for key for the duration of the block."""
+        lock, users = self._locks.get(key, (None, 0))
+        if lock is None:
+            lock = asyncio.Lock()
+        self._locks[key] = (lock, users + 1)
+        try:
+            async with lock:
+                yield
+        finally:
+            _, users = self._locks[key]
+            if users == 1:
+                del self._locks[key]
+            else:
+                self._locks[key] = (lock, users - 1)
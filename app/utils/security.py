@@ -2,11 +2,38 @@
 
 import hashlib
 import hmac
+from functools import lru_cache
 
 from structlog import get_logger
 
 logger = get_logger()
 
+_SIGNATURE_PREFIX = "sha256="
+_SIGNATURE_LENGTH = len(_SIGNATURE_PREFIX) + 2 * hashlib.sha256().digest_size
+
+
+@lru_cache(maxsize=4)
+def _keyed_hmac(secret: str) -> hmac.HMAC:
+    """Return an HMAC-SHA256 keyed with secret, to be copied per message."""
+    return hmac.new(secret.encode(), digestmod=hashlib.sha256)
+
+
+def _compute_digest(secret: str, body: bytes) -> bytes:
+    """Compute the raw HMAC-SHA256 digest of body."""
+    h = _keyed_hmac(secret).copy()
+    h.update(body)
+    return h.digest()
+
+
+def _parse_signature(signature: str) -> bytes | None:
+    """Decode a "sha256=<hex_digest>" header to raw bytes, or None if malformed."""
+    if len(signature) != _SIGNATURE_LENGTH or not signature.startswith(_SIGNATURE_PREFIX):
+        return None
+    try:
+        return bytes.fromhex(signature[len(_SIGNATURE_PREFIX) :])
+    except ValueError:
+        return None
+
 
 def verify_ashby_signature(
     secret: str,
@@ -28,18 +55,18 @@ def verify_ashby_signature(
     Returns:
         True if signature valid, False otherwise
     """
-    # Compute expected signature
-    h = hmac.new(secret.encode(), body, hashlib.sha256)
-    expected_digest = h.hexdigest()
-    expected_signature = f"sha256={expected_digest}"
+    # Malformed headers are rejected before hashing - header length is public,
+    # so this leaks nothing about the secret
+    provided_digest = _parse_signature(provided_signature)
 
-    # Constant-time comparison (security critical!)
-    is_valid = hmac.compare_digest(expected_signature, provided_signature)
+    # Constant-time comparison of raw digests (security critical!)
+    is_valid = provided_digest is not None and hmac.compare_digest(
+        _compute_digest(secret, body), provided_digest
+    )
 
     if not is_valid:
         logger.warning(
             "webhook_signature_invalid",
-            expected_prefix=expected_signature[:15],
             provided_prefix=provided_signature[:15] if provided_signature else None,
         )
 
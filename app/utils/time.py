@@ -1,6 +1,7 @@
 """Time utilities for timezone-aware timestamp handling."""
 
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, datetime
+from functools import lru_cache
 
 
 def parse_ashby_timestamp(ts_string: str | None) -> datetime | None:
@@ -13,7 +14,8 @@ def parse_ashby_timestamp(ts_string: str | None) -> datetime | None:
     """
     if not ts_string:
         return None
-    dt = datetime.fromisoformat(ts_string.replace("Z", "+00:00"))
+    # fromisoformat accepts the trailing "Z" natively on Python 3.11+
+    dt = datetime.fromisoformat(ts_string)
     return dt if dt.tzinfo else dt.replace(tzinfo=UTC)
 
 
@@ -22,7 +24,11 @@ def ensure_utc(dt: datetime) -> datetime:
     Ensure datetime is timezone-aware in UTC.
     If naive, assume UTC. If aware, convert to UTC.
     """
-    if dt.tzinfo is None:
+    tzinfo = dt.tzinfo
+    if tzinfo is UTC:
+        # Common case (parse_ashby_timestamp, asyncpg) - already UTC
+        return dt
+    if tzinfo is None:
         return dt.replace(tzinfo=UTC)
     return dt.astimezone(UTC)
 
@@ -37,9 +43,16 @@ def format_slack_timestamp(dt: datetime) -> str:
 
     Format reference: https://api.slack.com/reference/surfaces/formatting#date-formatting
     """
-    dt_utc = ensure_utc(dt)
-    unix_ts = int(dt_utc.timestamp())
-    fallback = dt_utc.strftime("%I:%M %p %Z")
+    # Aware datetimes convert straight to epoch seconds - no astimezone(UTC) needed
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    return _format_slack_unix_ts(int(dt.timestamp()))
+
+
+@lru_cache(maxsize=8192)
+def _format_slack_unix_ts(unix_ts: int) -> str:
+    """Render the Slack date token for a Unix timestamp (interviews share start times)."""
+    fallback = datetime.fromtimestamp(unix_ts, UTC).strftime("%I:%M %p UTC")
     return f"<!date^{unix_ts}^{{time}}|{fallback}>"
 
 
@@ -48,4 +61,4 @@ def is_stale(dt: datetime, hours: int = 24) -> bool:
     Check if datetime is older than specified hours.
     Always compares in UTC.
     """
-    return ensure_utc(dt) < datetime.now(UTC) - timedelta(hours=hours)
+    return (datetime.now(UTC) - ensure_utc(dt)).total_seconds() > hours * 3600
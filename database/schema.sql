@@ -151,6 +151,7 @@ CREATE TABLE IF NOT EXISTS feedback_reminders_sent (
 CREATE INDEX IF NOT EXISTS idx_feedback_reminders_sent_at
 ON feedback_reminders_sent(sent_at);
 
+-- Partial index also backs the pending_feedback count in /admin/stats
 CREATE INDEX IF NOT EXISTS idx_feedback_reminders_pending
 ON feedback_reminders_sent(event_id)
 WHERE submitted_at IS NULL;
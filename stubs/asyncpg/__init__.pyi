@@ -1,5 +1,6 @@
 """Type stubs for asyncpg."""
 
+from collections.abc import Callable
 from typing import Any, AsyncContextManager
 
 class Pool:
@@ -10,7 +11,32 @@ class Pool:
     ) -> AsyncContextManager[Connection]: ...
     async def close(self) -> None: ...
     def get_size(self) -> int: ...
+    def get_min_size(self) -> int: ...
     def get_idle_size(self) -> int: ...
+    async def execute(
+        self, query: str, *args: Any, timeout: float | None = None
+    ) -> str: ...
+    async def executemany(
+        self, command: str, args: Any, *, timeout: float | None = None
+    ) -> None: ...
+    async def copy_records_to_table(
+        self,
+        table_name: str,
+        *,
+        records: Any,
+        columns: list[str] | None = None,
+        schema_name: str | None = None,
+        timeout: float | None = None,
+    ) -> str: ...
+    async def fetch(
+        self, query: str, *args: Any, timeout: float | None = None
+    ) -> list[Record]: ...
+    async def fetchrow(
+        self, query: str, *args: Any, timeout: float | None = None
+    ) -> Record | None: ...
+    async def fetchval(
+        self, query: str, *args: Any, timeout: float | None = None
+    ) -> Any: ...
 
 class Connection:
     """AsyncPG database connection."""
@@ -18,6 +44,18 @@ class Connection:
     async def execute(
         self, query: str, *args: Any, timeout: float | None = None
     ) -> str: ...
+    async def executemany(
+        self, command: str, args: Any, *, timeout: float | None = None
+    ) -> None: ...
+    async def copy_records_to_table(
+        self,
+        table_name: str,
+        *,
+        records: Any,
+        columns: list[str] | None = None,
+        schema_name: str | None = None,
+        timeout: float | None = None,
+    ) -> str: ...
     async def fetch(
         self, query: str, *args: Any, timeout: float | None = None
     ) -> list[Record]: ...
@@ -28,6 +66,15 @@ class Connection:
         self, query: str, *args: Any, timeout: float | None = None
     ) -> Any: ...
     def transaction(self) -> AsyncContextManager[Transaction]: ...
+    async def set_type_codec(
+        self,
+        typename: str,
+        *,
+        schema: str = "public",
+        encoder: Callable[[Any], Any],
+        decoder: Callable[[Any], Any],
+        format: str = "text",
+    ) -> None: ...
 
 class Transaction:
     """Database transaction context."""
@@ -0,0 +1,9 @@
+"""Type stubs for slack_sdk.errors."""
+
+from typing import Any
+
+class SlackClientError(Exception): ...
+
+class SlackApiError(SlackClientError):
+    response: Any
+    def __init__(self, message: str, response: Any) -> None: ...
@@ -2,6 +2,8 @@
 
 from typing import Any, Iterator
 
+import aiohttp
+
 class AsyncSlackResponse:
     """Response from Slack async API calls - dict-like."""
 
@@ -24,6 +26,8 @@ class AsyncSlackResponse:
 class AsyncWebClient:
     """Async Slack Web API client."""
 
+    session: aiohttp.ClientSession | None
+
     def __init__(self, token: str, **kwargs: Any) -> None: ...
     async def chat_postMessage(self, **kwargs: Any) -> AsyncSlackResponse: ...
     async def views_open(self, **kwargs: Any) -> AsyncSlackResponse: ...
@@ -1,5 +1,6 @@
 """Pytest configuration for tests."""
 
+import asyncio
 import os
 from pathlib import Path
 from typing import Any, AsyncGenerator
@@ -25,13 +26,23 @@ os.environ.setdefault("DATABASE_URL", "postgresql://localhost:5432/ashby_feedbac
 os.environ.setdefault("LOG_LEVEL", "INFO")
 
 
-@pytest_asyncio.fixture
+@pytest.fixture(scope="session")
+def event_loop():
+    """Run all tests on one event loop so the session-scoped pool can be shared."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest_asyncio.fixture(scope="session")
 async def db_pool():
-    """Create a test database connection pool and initialize app's DB."""
+    """Create a test database connection pool (shared by the whole run) and initialize app's DB."""
     from app.core import database as db_module
     from app.core.config import settings
 
-    pool = await create_pool(settings.database_url, min_size=1, max_size=5)
+    pool = await create_pool(
+        settings.database_url, min_size=2, max_size=10, init=db_module.init_connection
+    )
 
     # Initialize the app's database singleton so service functions work
     db_module.db.pool = pool
@@ -46,17 +57,22 @@ async def db_pool():
 @pytest_asyncio.fixture
 async def clean_db(db_pool):
     """Clean database before each test."""
-    async with db_pool.acquire() as conn:
-        # Clear all tables in reverse dependency order
-        await conn.execute("DELETE FROM interview_assignments")
-        await conn.execute("DELETE FROM interview_events")
-        await conn.execute("DELETE FROM interview_schedules")
-        await conn.execute("DELETE FROM feedback_drafts")
-        await conn.execute("DELETE FROM feedback_reminders_sent")
-        await conn.execute("DELETE FROM feedback_form_definitions")
-        await conn.execute("DELETE FROM interviews")
-        await conn.execute("DELETE FROM slack_users")
-        await conn.execute("DELETE FROM ashby_webhook_payloads")
+    from app.services.feedback import clear_draft_cache
+    from app.services.sync import clear_form_definition_cache
+
+    # Cached form definitions and drafts would otherwise outlive their rows
+    clear_form_definition_cache()
+    clear_draft_cache()
+
+    # Clear all tables in one statement (TRUNCATE skips per-row MVCC work)
+    await db_pool.execute(
+        """
+        TRUNCATE interview_assignments, interview_events, interview_schedules,
+                 feedback_drafts, feedback_reminders_sent, feedback_form_definitions,
+                 interviews, slack_users, ashby_webhook_payloads
+        RESTART IDENTITY
+    """
+    )
 
     yield db_pool
 
@@ -119,8 +135,6 @@ async def sample_interview(clean_db):
 @pytest_asyncio.fixture
 async def sample_feedback_form(clean_db):
     """Create a sample feedback form definition in the database."""
-    import json
-
     form_def_id = uuid4()
 
     form_definition = {
@@ -154,7 +168,7 @@ async def sample_feedback_form(clean_db):
             """,
             form_def_id,
             "Technical Interview Feedback",
-            json.dumps(form_definition),
+            form_definition,
             False,
         )
 
@@ -172,65 +186,59 @@ async def sample_interview_event(
     stage_id = uuid4()
     interviewer_id = uuid4()
 
-    async with clean_db.acquire() as conn:
-        # Create schedule
-        await conn.execute(
-            """
+    # Create schedule, event and interviewer assignment in one round-trip
+    await clean_db.execute(
+        """
+        WITH s AS (
             INSERT INTO interview_schedules
             (schedule_id, application_id, interview_stage_id, status, candidate_id, updated_at)
             VALUES ($1, $2, $3, $4, $5, NOW())
-            """,
-            schedule_id,
-            application_id,
-            stage_id,
-            "Scheduled",
-            "candidate_test",
-        )
-
-        # Create event
-        await conn.execute(
-            """
+            RETURNING schedule_id
+        ), e AS (
             INSERT INTO interview_events
             (event_id, schedule_id, interview_id, created_at, updated_at,
              start_time, end_time, feedback_link, location, meeting_link,
              has_submitted_feedback, extra_data)
-            VALUES ($1, $2, $3, NOW(), NOW(), NOW() + INTERVAL '1 hour', NOW() + INTERVAL '2 hours',
-                    $4, $5, $6, $7, $8)
-            """,
-            event_id,
-            schedule_id,
-            UUID(sample_interview["interview_id"]),  # Convert string to UUID
-            "https://ashby.com/feedback",
-            "Zoom",
-            "https://zoom.us/test",
-            False,
-            "{}",
-        )
-
-        # Create interviewer assignment
-        await conn.execute(
-            """
-            INSERT INTO interview_assignments
-            (event_id, interviewer_id, first_name, last_name, email,
-             global_role, training_role, is_enabled, manager_id,
-             interviewer_pool_id, interviewer_pool_title,
-             interviewer_pool_is_archived, training_path, interviewer_updated_at)
-            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, NOW())
-            """,
-            event_id,
-            interviewer_id,
-            "Test",
-            "User",
-            "test@example.com",
-            "Interviewer",
-            "Trained",
-            True,
-            None,
-            uuid4(),
-            "Test Pool",
-            False,
-            "{}",
+            SELECT $6::uuid, s.schedule_id, $7::uuid, NOW(), NOW(),
+                   NOW() + INTERVAL '1 hour', NOW() + INTERVAL '2 hours',
+                   $8::text, $9::text, $10::text, $11::boolean, $12::jsonb
+            FROM s
+            RETURNING event_id
         )
+        INSERT INTO interview_assignments
+        (event_id, interviewer_id, first_name, last_name, email,
+         global_role, training_role, is_enabled, manager_id,
+         interviewer_pool_id, interviewer_pool_title,
+         interviewer_pool_is_archived, training_path, interviewer_updated_at)
+        SELECT e.event_id, $13::uuid, $14::text, $15::text, $16::text, $17::text, $18::text,
+               $19::boolean, $20::uuid, $21::uuid, $22::text, $23::boolean, $24::jsonb, NOW()
+        FROM e
+        """,
+        schedule_id,
+        application_id,
+        stage_id,
+        "Scheduled",
+        "candidate_test",
+        event_id,
+        UUID(sample_interview["interview_id"]),  # Convert string to UUID
+        "https://ashby.com/feedback",
+        "Zoom",
+        "https://zoom.us/test",
+        False,
+        {},
+        interviewer_id,
+        "Test",
+        "User",
+        "test@example.com",
+        "Interviewer",
+        "Trained",
+        True,
+        None,
+        uuid4(),
+        "Test Pool",
+        False,
+        {},
+    )
 
     return {
         "event_id": str(event_id),
@@ -243,10 +251,20 @@ async def sample_interview_event(
 @pytest.fixture
 def mock_ashby_client(monkeypatch):
     """Create and inject mocked Ashby client."""
+    from app.clients.ashby import clear_candidate_cache
+    from app.services.interviews import clear_interview_cache
+    from app.services.reminders import clear_resume_cache
+    from app.services.sync import clear_job_cache
     from tests.fixtures.mock_clients import MockAshbyClient
 
     mock_client = MockAshbyClient()
 
+    # Cached Ashby responses must not leak between tests
+    clear_candidate_cache()
+    clear_interview_cache()
+    clear_job_cache()
+    clear_resume_cache()
+
     # Add helper methods first before referencing them
     async def fetch_candidate_info(candidate_id: str):
         response = await mock_client.post("candidate.info", {"id": candidate_id})
@@ -276,15 +294,23 @@ def mock_ashby_client(monkeypatch):
     yield mock_client
 
     mock_client.reset()
+    clear_candidate_cache()
+    clear_interview_cache()
+    clear_job_cache()
+    clear_resume_cache()
 
 
 @pytest.fixture
 def mock_slack_client(monkeypatch):
     """Create and inject mocked Slack client."""
+    from app.api.slack_interactions import clear_dm_failures
     from tests.fixtures.mock_clients import MockSlackClient
 
     mock_client = MockSlackClient()
 
+    # DM failure backoff must not leak between tests
+    clear_dm_failures()
+
     # Patch the module-level singleton
     monkeypatch.setattr("app.clients.slack.slack_client", mock_client)
 
@@ -296,6 +322,7 @@ def mock_slack_client(monkeypatch):
     yield mock_client
 
     mock_client.reset()
+    clear_dm_failures()
 
 
 @pytest.fixture
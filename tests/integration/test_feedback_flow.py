@@ -95,6 +95,70 @@ class TestFeedbackDraftFlow:
         assert loaded["field1"] == "updated_value"
         assert loaded["field2"] == "new_field"
 
+    @pytest.mark.asyncio
+    async def test_repeat_load_served_from_cache(
+        self, clean_db, sample_interview_event, monkeypatch
+    ):
+        """Test that reopening a draft skips the database until it is saved again."""
+        from app.core.database import db
+
+        event_id = sample_interview_event["event_id"]
+        interviewer_id = sample_interview_event["interviewer_id"]
+        await save_draft(event_id, interviewer_id, {"field1": "value1"})
+
+        fetches = []
+        original_fetchrow = db.fetchrow
+
+        async def counting_fetchrow(query, *args):
+            fetches.append(query)
+            return await original_fetchrow(query, *args)
+
+        monkeypatch.setattr(db, "fetchrow", counting_fetchrow)
+
+        await load_draft(event_id, interviewer_id)
+        cached = await load_draft(event_id, interviewer_id)
+        assert cached["field1"] == "value1"
+        assert len(fetches) == 1
+
+        # Saving invalidates the cached copy
+        await save_draft(event_id, interviewer_id, {"field1": "value2"})
+        reloaded = await load_draft(event_id, interviewer_id)
+        assert reloaded["field1"] == "value2"
+        assert len(fetches) == 2
+
+    @pytest.mark.asyncio
+    async def test_save_writes_full_draft_after_row_removed(self, clean_db, sample_interview_event):
+        """Test that a save restores every field even if the row vanished behind the cache."""
+        event_id = sample_interview_event["event_id"]
+        interviewer_id = sample_interview_event["interviewer_id"]
+        values = {"field1": "value1", "field2": "value2"}
+        await save_draft(event_id, interviewer_id, values)
+        await load_draft(event_id, interviewer_id)
+
+        # Another worker deletes the draft; this process still has it cached
+        async with clean_db.acquire() as conn:
+            await conn.execute(
+                """
+                DELETE FROM feedback_drafts
+                WHERE event_id = $1::uuid AND interviewer_id = $2::uuid
+                """,
+                event_id,
+                interviewer_id,
+            )
+
+        await save_draft(event_id, interviewer_id, values)
+
+        async with clean_db.acquire() as conn:
+            stored = await conn.fetchval(
+                """
+                SELECT form_values FROM feedback_drafts
+                WHERE event_id = $1::uuid AND interviewer_id = $2::uuid
+                """,
+                event_id,
+                interviewer_id,
+            )
+        assert stored == values
+
     @pytest.mark.asyncio
     async def test_empty_draft_not_saved(self, clean_db, sample_interview_event):
         """Test that empty form values don't create draft."""
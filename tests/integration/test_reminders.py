@@ -58,7 +58,7 @@ class TestReminderWindowDetection:
                 "Zoom",
                 "https://zoom.us/test",
                 False,
-                "{}",
+                {},
             )
 
             # Create interviewer assignment
@@ -83,7 +83,7 @@ class TestReminderWindowDetection:
                 uuid4(),
                 "Test Pool",
                 False,
-                "{}",
+                {},
             )
 
             # Query for reminders (should find this one)
@@ -167,7 +167,7 @@ class TestReminderWindowDetection:
                 "Zoom",
                 "https://zoom.us/test",
                 False,
-                "{}",
+                {},
             )
 
             await conn.execute(
@@ -191,7 +191,7 @@ class TestReminderWindowDetection:
                 uuid4(),
                 "Test Pool",
                 False,
-                "{}",
+                {},
             )
 
             # Query should NOT find past interviews
@@ -257,7 +257,7 @@ class TestReminderWindowDetection:
                 "Zoom",
                 "https://zoom.us/test",
                 False,
-                "{}",
+                {},
             )
 
             await conn.execute(
@@ -281,7 +281,7 @@ class TestReminderWindowDetection:
                 uuid4(),
                 "Test Pool",
                 False,
-                "{}",
+                {},
             )
 
             # Query should NOT find future interviews beyond 20 min
@@ -350,7 +350,7 @@ class TestReminderWindowDetection:
                 "Zoom",
                 "https://zoom.us/test",
                 False,
-                "{}",
+                {},
             )
 
             # Record that reminder was sent
@@ -429,7 +429,7 @@ class TestReminderWindowDetection:
                 "Zoom",
                 "https://zoom.us/test",
                 False,
-                "{}",
+                {},
             )
 
             await conn.execute(
@@ -453,7 +453,7 @@ class TestReminderWindowDetection:
                 uuid4(),
                 "Test Pool",
                 False,
-                "{}",
+                {},
             )
 
             # Query should NOT find cancelled interviews
@@ -473,6 +473,37 @@ class TestReminderWindowDetection:
             assert len(results) == 0
 
 
+class TestRecordReminderSent:
+    """Integration tests for recording sent reminders."""
+
+    @pytest.mark.asyncio
+    async def test_receipt_recorded(self, clean_db, sample_interview_event):
+        """Test that a receipt for an existing event is stored."""
+        from app.services.reminders import record_reminder_sent
+
+        event_id = sample_interview_event["event_id"]
+        interviewer_id = sample_interview_event["interviewer_id"]
+
+        await record_reminder_sent(
+            (event_id, interviewer_id, "U123456", "D123456", "1234567890.123456")
+        )
+
+        async with clean_db.acquire() as conn:
+            count = await conn.fetchval("SELECT COUNT(*) FROM feedback_reminders_sent")
+        assert count == 1
+
+    @pytest.mark.asyncio
+    async def test_receipt_for_deleted_event_skipped(self, clean_db, sample_slack_user):
+        """Test that a receipt whose event was deleted is dropped instead of raising."""
+        from app.services.reminders import record_reminder_sent
+
+        await record_reminder_sent((uuid4(), uuid4(), "U123456", "D123456", "1234567890.123456"))
+
+        async with clean_db.acquire() as conn:
+            count = await conn.fetchval("SELECT COUNT(*) FROM feedback_reminders_sent")
+        assert count == 0
+
+
 class TestReminderMessageBuilding:
     """Unit-style tests for reminder message construction."""
 
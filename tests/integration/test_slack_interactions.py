@@ -1,10 +1,13 @@
 """Integration tests for Slack interactions API."""
 
+import asyncio
 import json
 from unittest.mock import AsyncMock
+from urllib.parse import urlencode
 
 import pytest
 import pytest_asyncio
+from slack_sdk.errors import SlackApiError
 
 from tests.fixtures.factories import (
     create_ashby_api_response,
@@ -13,6 +16,15 @@ from tests.fixtures.factories import (
 )
 
 
+def create_interaction_request(payload: dict) -> AsyncMock:
+    """Helper to build a mock request carrying a url-encoded Slack payload."""
+    mock_request = AsyncMock()
+    mock_request.body = AsyncMock(
+        return_value=urlencode({"payload": json.dumps(payload)}).encode()
+    )
+    return mock_request
+
+
 class TestHandleSlackInteractions:
     """Test the main Slack interactions endpoint dispatcher."""
 
@@ -52,8 +64,7 @@ class TestHandleSlackInteractions:
             },
         )
 
-        mock_request = AsyncMock()
-        mock_request.form = AsyncMock(return_value={"payload": json.dumps(payload)})
+        mock_request = create_interaction_request(payload)
 
         # Call endpoint
         response = await handle_slack_interactions(mock_request)
@@ -62,6 +73,11 @@ class TestHandleSlackInteractions:
         assert isinstance(response, Response)
         assert response.status_code == 200
 
+        # Modal is opened from a background task after the ack
+        from app.api.slack_interactions import _background_tasks
+
+        await asyncio.gather(*_background_tasks)
+
         # Verify Slack modal was opened
         assert mock_slack_client.was_called("open_modal")
 
@@ -92,8 +108,7 @@ class TestHandleSlackInteractions:
             },
         )
 
-        mock_request = AsyncMock()
-        mock_request.form = AsyncMock(return_value={"payload": json.dumps(payload)})
+        mock_request = create_interaction_request(payload)
 
         # Call endpoint
         response = await handle_slack_interactions(mock_request)
@@ -144,8 +159,7 @@ class TestHandleSlackInteractions:
             },
         )
 
-        mock_request = AsyncMock()
-        mock_request.form = AsyncMock(return_value={"payload": json.dumps(payload)})
+        mock_request = create_interaction_request(payload)
 
         # Call endpoint
         response = await handle_slack_interactions(mock_request)
@@ -163,8 +177,7 @@ class TestHandleSlackInteractions:
 
         payload = create_slack_interaction_payload(interaction_type="view_closed")
 
-        mock_request = AsyncMock()
-        mock_request.form = AsyncMock(return_value={"payload": json.dumps(payload)})
+        mock_request = create_interaction_request(payload)
 
         # Call endpoint
         response = await handle_slack_interactions(mock_request)
@@ -257,6 +270,35 @@ class TestHandleOpenModal:
         # Verify modal was NOT opened
         assert not mock_slack_client.was_called("open_modal")
 
+    @pytest.mark.asyncio
+    async def test_handle_open_modal_missing_form_skips_candidate_lookup(
+        self, mock_ashby_client, mock_slack_client, clean_db
+    ):
+        """Test that no candidate lookup is made when the form definition is missing."""
+        from app.api.slack_interactions import handle_open_modal
+
+        mock_ashby_client.add_response(
+            "feedbackFormDefinition.info",
+            {"success": False, "error": "Form not found"},
+        )
+
+        payload = {"trigger_id": "trigger_test", "user": {"id": "U123456"}}
+        action = {
+            "value": json.dumps(
+                {
+                    "event_id": "event_test",
+                    "form_definition_id": "form_invalid",
+                    "application_id": "app_test",
+                    "interviewer_id": "interviewer_test",
+                    "candidate_id": "candidate_test",
+                }
+            )
+        }
+
+        await handle_open_modal(payload, action)
+
+        assert mock_ashby_client.get_call_count("candidate.info") == 0
+
     @pytest.mark.asyncio
     async def test_handle_open_modal_candidate_fetch_failure(
         self, mock_ashby_client, mock_slack_client, clean_db, sample_interview_event
@@ -395,6 +437,11 @@ class TestHandleFeedbackSubmission:
         # Call handler
         await handle_feedback_submission(payload)
 
+        # Confirmation DM is sent from a background task
+        from app.api.slack_interactions import _background_tasks
+
+        await asyncio.gather(*_background_tasks)
+
         # Verify Ashby was called
         assert mock_ashby_client.was_called("applicationFeedback.submit")
 
@@ -503,6 +550,70 @@ class TestHandleFeedbackSubmission:
         assert draft_after == {}
 
 
+def _slack_error(error: str) -> SlackApiError:
+    """Build the SlackApiError the SDK raises for an ok=false response."""
+    return SlackApiError("The request to the Slack API failed.", {"ok": False, "error": error})
+
+
+class TestSendDmBestEffort:
+    """Test best-effort DM backoff after failures."""
+
+    @pytest.mark.asyncio
+    async def test_recent_failure_skips_next_dm(self, mock_slack_client):
+        """Test that a failed DM suppresses further attempts for the same user."""
+        from app.api import slack_interactions
+
+        user_id = "UDMFAIL"
+        mock_slack_client.send_dm = AsyncMock(side_effect=_slack_error("channel_not_found"))
+
+        await slack_interactions._send_dm_best_effort(user_id, "first")
+        await slack_interactions._send_dm_best_effort(user_id, "second")
+
+        assert mock_slack_client.send_dm.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_transient_failure_retries_next_dm(self, mock_slack_client):
+        """Test that a rate limit or timeout does not suppress the next DM."""
+        from app.api import slack_interactions
+
+        user_id = "UDMBLIP"
+        mock_slack_client.send_dm = AsyncMock(
+            side_effect=[_slack_error("ratelimited"), TimeoutError(), None]
+        )
+
+        for text in ("first", "second", "third"):
+            await slack_interactions._send_dm_best_effort(user_id, text)
+
+        assert mock_slack_client.send_dm.await_count == 3
+        assert user_id not in slack_interactions._dm_fail_until
+
+    @pytest.mark.asyncio
+    async def test_expired_failure_is_pruned(self, mock_slack_client):
+        """Test that an expired backoff entry is dropped and the DM is retried."""
+        from app.api import slack_interactions
+
+        user_id = "UDMEXPIRED"
+        slack_interactions._dm_fail_until[user_id] = 0.0
+
+        await slack_interactions._send_dm_best_effort(user_id, "retry")
+
+        assert mock_slack_client.get_call_count("send_dm") == 1
+        assert user_id not in slack_interactions._dm_fail_until
+
+    @pytest.mark.asyncio
+    async def test_failure_cache_is_bounded(self, mock_slack_client, monkeypatch):
+        """Test that the oldest failure is evicted once the cache is full."""
+        from app.api import slack_interactions
+
+        monkeypatch.setattr(slack_interactions, "DM_FAILURE_CACHE_MAX_SIZE", 2)
+        mock_slack_client.send_dm = AsyncMock(side_effect=_slack_error("user_not_found"))
+
+        for user_id in ("U1", "U2", "U3"):
+            await slack_interactions._send_dm_best_effort(user_id, "hello")
+
+        assert list(slack_interactions._dm_fail_until) == ["U2", "U3"]
+
+
 class TestHandleDispatchAutoSave:
     """Test auto-save on Enter key functionality."""
 
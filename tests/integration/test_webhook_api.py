@@ -9,13 +9,17 @@ import pytest
 from tests.fixtures.factories import create_ashby_webhook_payload
 
 
-def create_webhook_request(body: bytes, signature: str | None = None):
+def create_webhook_request(
+    body: bytes, signature: str | None = None, content_length: int | None = None
+):
     """Helper to create a proper Starlette Request for webhook tests."""
     from starlette.requests import Request
 
     headers = []
     if signature:
         headers.append([b"ashby-signature", signature.encode()])
+    if content_length is not None:
+        headers.append([b"content-length", str(content_length).encode()])
 
     scope = {
         "type": "http",
@@ -160,6 +164,51 @@ class TestWebhookEndpoint:
 
         assert exc_info.value.status_code == 400
 
+    @pytest.mark.asyncio
+    async def test_webhook_endpoint_invalid_signature_checked_before_parse(self):
+        """Test that signed requests are rejected before the body is parsed."""
+        from fastapi import HTTPException
+
+        from app.api.webhooks import handle_ashby_webhook
+
+        # Malformed JSON with a bad signature should fail auth, not parsing
+        body = b"not valid json {"
+        request = create_webhook_request(body, "sha256=invalid_signature_value")
+
+        with pytest.raises(HTTPException) as exc_info:
+            await handle_ashby_webhook(request)
+
+        assert exc_info.value.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_webhook_endpoint_oversized_body_returns_413(self):
+        """Test that oversized bodies are rejected without processing."""
+        from fastapi import HTTPException
+
+        from app.api.webhooks import MAX_WEBHOOK_BODY_BYTES, handle_ashby_webhook
+
+        body = b" " * (MAX_WEBHOOK_BODY_BYTES + 1)
+        request = create_webhook_request(body, None)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await handle_ashby_webhook(request)
+
+        assert exc_info.value.status_code == 413
+
+    @pytest.mark.asyncio
+    async def test_webhook_endpoint_oversized_content_length_returns_413(self):
+        """Test that a declared oversized body is rejected before it is read."""
+        from fastapi import HTTPException
+
+        from app.api.webhooks import MAX_WEBHOOK_BODY_BYTES, handle_ashby_webhook
+
+        request = create_webhook_request(b"{}", None, content_length=MAX_WEBHOOK_BODY_BYTES + 1)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await handle_ashby_webhook(request)
+
+        assert exc_info.value.status_code == 413
+
     @pytest.mark.asyncio
     async def test_webhook_endpoint_invalid_payload_structure_returns_400(self):
         """Test that invalid payload structure is rejected."""
@@ -223,6 +272,11 @@ class TestWebhookEndpoint:
         # Call webhook
         await handle_ashby_webhook(request)
 
+        # Audit rows are written in batches - flush before checking
+        from app.services.audit import webhook_audit
+
+        await webhook_audit.flush()
+
         # Verify audit log entry
         audit_row = await db.fetchrow(
             """
@@ -434,3 +434,37 @@ class TestWebhookFlow:
             assert event_row is not None
             assert event_row["location"] is None
             assert event_row["meeting_link"] is None
+
+    @pytest.mark.asyncio
+    async def test_fresh_interview_skips_api_refresh(
+        self, clean_db, sample_interview, mock_ashby_client
+    ):
+        """Test that an interview synced within the last hour is not re-fetched."""
+        schedule_id = uuid4()
+        event_id = uuid4()
+
+        schedule = {
+            "id": str(schedule_id),
+            "status": "Scheduled",
+            "applicationId": str(uuid4()),
+            "interviewStageId": str(uuid4()),
+            "interviewEvents": [
+                {
+                    "id": str(event_id),
+                    "interviewId": sample_interview["interview_id"],
+                    "startTime": "2024-10-20T14:00:00.000Z",
+                    "endTime": "2024-10-20T15:00:00.000Z",
+                    "interviewers": [],
+                }
+            ],
+        }
+
+        await process_schedule_update(schedule)
+
+        assert not mock_ashby_client.was_called("interview.info")
+        async with clean_db.acquire() as conn:
+            event_count = await conn.fetchval(
+                "SELECT COUNT(*) FROM interview_events WHERE event_id = $1",
+                event_id,
+            )
+            assert event_count == 1
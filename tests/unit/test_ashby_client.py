@@ -0,0 +1,90 @@
+"""Unit tests for Ashby client helpers."""
+
+import pytest
+
+from app.clients.ashby import (
+    clear_candidate_cache,
+    fetch_candidate_info,
+    fetch_candidates,
+)
+from tests.fixtures.factories import create_ashby_api_response
+
+
+class TestFetchCandidateInfoCache:
+    """Tests for the candidate.info TTL cache."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_fetch_uses_cache(self, mock_ashby_client):
+        """Test that a second fetch for the same candidate skips the API."""
+        mock_ashby_client.add_response(
+            "candidate.info", create_ashby_api_response("candidate.info")
+        )
+
+        first = await fetch_candidate_info("candidate_test")
+        second = await fetch_candidate_info("candidate_test")
+
+        assert first == second
+        assert mock_ashby_client.get_call_count("candidate.info") == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_is_not_cached(self, mock_ashby_client):
+        """Test that API failures are not cached."""
+        mock_ashby_client.add_response(
+            "candidate.info", {"success": False, "error": "Candidate not found"}
+        )
+        mock_ashby_client.add_response(
+            "candidate.info", create_ashby_api_response("candidate.info")
+        )
+
+        with pytest.raises(Exception, match="Failed to fetch candidate info: Candidate not found"):
+            await fetch_candidate_info("candidate_test")
+
+        result = await fetch_candidate_info("candidate_test")
+
+        assert result["id"] == "candidate_test"
+        assert mock_ashby_client.get_call_count("candidate.info") == 2
+
+    @pytest.mark.asyncio
+    async def test_clear_cache_forces_refetch(self, mock_ashby_client):
+        """Test that clearing the cache forces a fresh API call."""
+        for _ in range(2):
+            mock_ashby_client.add_response(
+                "candidate.info", create_ashby_api_response("candidate.info")
+            )
+
+        await fetch_candidate_info("candidate_test")
+        clear_candidate_cache()
+        await fetch_candidate_info("candidate_test")
+
+        assert mock_ashby_client.get_call_count("candidate.info") == 2
+
+
+class TestFetchCandidates:
+    """Tests for the concurrent fetch_candidates helper."""
+
+    @pytest.mark.asyncio
+    async def test_fetches_each_unique_candidate_once(self, mock_ashby_client):
+        """Test that duplicate IDs only trigger one API call each."""
+        for candidate_id in ("cand_1", "cand_2"):
+            mock_ashby_client.add_response(
+                "candidate.info",
+                create_ashby_api_response(
+                    "candidate.info", {"id": candidate_id, "name": "Candidate"}
+                ),
+            )
+
+        result = await fetch_candidates(["cand_1", "cand_2", "cand_1"])
+
+        assert set(result) == {"cand_1", "cand_2"}
+        assert mock_ashby_client.get_call_count("candidate.info") == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_candidates_are_omitted(self, mock_ashby_client):
+        """Test that a failed lookup does not fail the whole batch."""
+        mock_ashby_client.add_response(
+            "candidate.info", {"success": False, "error": "Candidate not found"}
+        )
+
+        result = await fetch_candidates(["cand_missing"])
+
+        assert result == {}
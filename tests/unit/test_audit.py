@@ -0,0 +1,51 @@
+"""Unit tests for the webhook audit writer."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.database import db
+from app.services import audit
+from app.services.audit import WebhookAuditWriter
+
+
+class TestWebhookAuditWriter:
+    """Tests for WebhookAuditWriter."""
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_leftover_rows(self, monkeypatch):
+        """Test that rows still buffered at shutdown are written by stop()."""
+        copy = AsyncMock()
+        monkeypatch.setattr(db, "copy_records_to_table", copy)
+        writer = WebhookAuditWriter(flush_interval=60)
+        writer.start()
+
+        writer.enqueue("sched_1", "interviewScheduleUpdate", b"{}")
+        writer.enqueue("sched_2", "interviewScheduleUpdate", b"{}")
+        await writer.stop()
+
+        copy.assert_awaited_once()
+        assert len(copy.await_args.kwargs["records"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_copy_is_logged_and_writer_keeps_running(self, monkeypatch):
+        """Test that a COPY error is logged without killing the background task."""
+        copy = AsyncMock(side_effect=[Exception("connection lost"), None])
+        monkeypatch.setattr(db, "copy_records_to_table", copy)
+        logger = MagicMock()
+        monkeypatch.setattr(audit, "logger", logger)
+        writer = WebhookAuditWriter(max_batch=1)
+        writer.start()
+
+        try:
+            writer.enqueue("sched_1", "interviewScheduleUpdate", b"{}")
+            await asyncio.sleep(0.01)
+            writer.enqueue("sched_2", "interviewScheduleUpdate", b"{}")
+            await asyncio.sleep(0.01)
+
+            assert not writer._task.done()
+            assert copy.await_count == 2
+            logger.exception.assert_called_once_with("webhook_audit_flush_failed", count=1)
+        finally:
+            await writer.stop()
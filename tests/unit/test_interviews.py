@@ -0,0 +1,65 @@
+"""Unit tests for interview service helpers."""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from app.services.interviews import build_event_rows, fetch_interviews
+from tests.fixtures.factories import create_ashby_api_response, create_ashby_webhook_payload
+
+
+class TestFetchInterviews:
+    """Tests for prefetching interview.info with a TTL cache."""
+
+    @pytest.mark.asyncio
+    async def test_duplicate_ids_fetched_once_and_cached(self, mock_ashby_client):
+        """Test that duplicate IDs share one call and repeat lookups skip the API."""
+        mock_ashby_client.add_response(
+            "interview.info", create_ashby_api_response("interview.info")
+        )
+
+        first = await fetch_interviews(["interview_test", "interview_test"])
+        second = await fetch_interviews(["interview_test"])
+
+        assert first["interview_test"]["title"] == "Technical Interview"
+        assert second == first
+        assert mock_ashby_client.get_call_count("interview.info") == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_omitted_and_not_cached(self, mock_ashby_client):
+        """Test that failures are left out of the result and retried next time."""
+        mock_ashby_client.add_response(
+            "interview.info", create_ashby_api_response("interview.info", success=False)
+        )
+        mock_ashby_client.add_response(
+            "interview.info", create_ashby_api_response("interview.info")
+        )
+
+        assert await fetch_interviews(["interview_test"]) == {}
+        assert "interview_test" in await fetch_interviews(["interview_test"])
+        assert mock_ashby_client.get_call_count("interview.info") == 2
+
+
+class TestBuildEventRows:
+    """Tests for building COPY records from a schedule payload."""
+
+    def test_rows_follow_column_order_with_parsed_timestamps(self):
+        """Test that event and assignment records carry timezone-aware datetimes."""
+        schedule = create_ashby_webhook_payload(schedule_id="sched_1", event_id="event_1")["data"][
+            "interviewSchedule"
+        ]
+
+        event_rows, assignment_rows = build_event_rows(schedule, "sched_1")
+
+        assert len(event_rows) == 1
+        assert event_rows[0][:2] == ("event_1", "sched_1")
+        assert event_rows[0][5] == datetime(2024, 10, 20, 14, 0, tzinfo=UTC)
+        assert len(assignment_rows) == 1
+        assert assignment_rows[0][0] == "event_1"
+        assert assignment_rows[0][-1] == datetime(2024, 10, 19, 10, 0, tzinfo=UTC)
+
+    def test_event_without_interview_id_skipped(self):
+        """Test that events missing an interview reference produce no records."""
+        schedule = {"interviewEvents": [{"id": "event_1", "interviewers": [{"id": "i_1"}]}]}
+
+        assert build_event_rows(schedule, "sched_1") == ([], [])
@@ -0,0 +1,64 @@
+"""Unit tests for per-key locks."""
+
+import asyncio
+
+import pytest
+
+from app.utils.locks import KeyedLocks
+
+
+class TestKeyedLocks:
+    """Tests for KeyedLocks."""
+
+    @pytest.mark.asyncio
+    async def test_waiters_share_one_lock(self):
+        """Test that three tasks on one key run one at a time."""
+        locks = KeyedLocks()
+        active = 0
+        peak = 0
+
+        async def worker():
+            nonlocal active, peak
+            async with locks.hold("key"):
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0)
+                active -= 1
+
+        await asyncio.gather(worker(), worker(), worker())
+
+        assert peak == 1
+
+    @pytest.mark.asyncio
+    async def test_lock_kept_while_waiters_remain(self):
+        """Test that a key stays tracked until its last waiter leaves."""
+        locks = KeyedLocks()
+        release_first = asyncio.Event()
+        release_second = asyncio.Event()
+
+        async def holder(release):
+            async with locks.hold("key"):
+                await release.wait()
+
+        first = asyncio.create_task(holder(release_first))
+        second = asyncio.create_task(holder(release_second))
+        await asyncio.sleep(0)
+
+        release_first.set()
+        await first
+        assert len(locks) == 1
+
+        release_second.set()
+        await second
+        assert len(locks) == 0
+
+    @pytest.mark.asyncio
+    async def test_lock_dropped_after_error(self):
+        """Test that a key is released when the block raises."""
+        locks = KeyedLocks()
+
+        with pytest.raises(RuntimeError, match="boom"):
+            async with locks.hold("key"):
+                raise RuntimeError("boom")
+
+        assert len(locks) == 0
@@ -0,0 +1,41 @@
+"""Unit tests for reminder service helpers."""
+
+import asyncio
+
+import pytest
+
+from app.services.reminders import register_resume
+from tests.fixtures.factories import create_ashby_api_response
+
+
+class TestRegisterResume:
+    """Tests for the per-candidate resume registration cache."""
+
+    @pytest.mark.asyncio
+    async def test_panel_shares_one_registration(self, mock_ashby_client, mock_slack_client):
+        """Test that concurrent reminders for one candidate register the resume once."""
+        mock_ashby_client.add_response(
+            "file.info", create_ashby_api_response("file.info", {"url": "https://s3/r.pdf"})
+        )
+
+        results = await asyncio.gather(
+            *(register_resume("cand_1", "handle_1", "resume.pdf") for _ in range(5))
+        )
+
+        assert results == ["resume_cand_1"] * 5
+        assert mock_ashby_client.get_call_count("file.info") == 1
+        assert mock_slack_client.get_call_count("register_remote_file") == 1
+
+    @pytest.mark.asyncio
+    async def test_missing_url_not_cached(self, mock_ashby_client, mock_slack_client):
+        """Test that a failed URL lookup is retried on the next reminder."""
+        mock_ashby_client.add_response(
+            "file.info", create_ashby_api_response("file.info", success=False)
+        )
+        mock_ashby_client.add_response(
+            "file.info", create_ashby_api_response("file.info", {"url": "https://s3/r.pdf"})
+        )
+
+        assert await register_resume("cand_1", "handle_1", "resume.pdf") is None
+        assert await register_resume("cand_1", "handle_1", "resume.pdf") == "resume_cand_1"
+        assert mock_slack_client.get_call_count("register_remote_file") == 1
@@ -93,3 +93,13 @@ def test_verify_ashby_signature_format():
     # With prefix should pass
     signature_with_prefix = f"sha256={hex_digest}"
     assert verify_ashby_signature(secret, body, signature_with_prefix) is True
+
+
+def test_verify_ashby_signature_malformed_header():
+    """Test that truncated or non-hex signatures fail verification."""
+    secret = "test_secret"
+    body = b'{"action": "test", "data": {}}'
+    hex_digest = hmac.new(secret.encode(), body, digestmod="sha256").hexdigest()
+
+    assert verify_ashby_signature(secret, body, f"sha256={hex_digest[:-2]}") is False
+    assert verify_ashby_signature(secret, body, f"sha256={hex_digest[:-1]}z") is False
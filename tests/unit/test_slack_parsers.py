@@ -0,0 +1,71 @@
+"""Unit tests for Slack modal state parsers."""
+
+from app.clients.slack_parsers import (
+    build_field_type_map,
+    extract_field_submissions_for_ashby,
+    extract_form_values,
+)
+
+FORM_DEFINITION = {
+    "formDefinition": {
+        "sections": [
+            {
+                "fields": [
+                    {"field": {"path": "notes", "type": "RichText"}},
+                    {"field": {"path": "score", "type": "Score"}},
+                    {"field": {"path": "years", "type": "Number"}},
+                ]
+            }
+        ]
+    }
+}
+
+STATE_VALUES = {
+    "field_notes": {"notes": {"type": "plain_text_input", "value": "Great call"}},
+    "field_score": {"score": {"type": "static_select", "selected_option": {"value": "3"}}},
+    "field_years": {"years": {"type": "number_input", "value": "5"}},
+    "field_remote": {"remote": {"type": "checkboxes", "selected_options": []}},
+    "field_level": {"level": {"type": "static_select", "selected_option": None}},
+    "other_block": {"x": {"type": "plain_text_input", "value": "ignored"}},
+}
+
+
+class TestBuildFieldTypeMap:
+    """Tests for build_field_type_map."""
+
+    def test_maps_all_fields(self):
+        """Test that every field in the form is mapped."""
+        result = build_field_type_map(FORM_DEFINITION)
+
+        assert result == {"notes": "RichText", "score": "Score", "years": "Number"}
+
+    def test_only_paths_limits_result(self):
+        """Test that only requested paths are mapped."""
+        result = build_field_type_map(FORM_DEFINITION, {"score"})
+
+        assert result == {"score": "Score"}
+
+
+class TestExtractFormValues:
+    """Tests for extract_form_values."""
+
+    def test_extracts_draft_values(self):
+        """Test extraction of raw values for draft saving."""
+        result = extract_form_values(STATE_VALUES)
+
+        assert result == {"notes": "Great call", "score": "3", "years": "5", "remote": False}
+
+
+class TestExtractFieldSubmissionsForAshby:
+    """Tests for extract_field_submissions_for_ashby."""
+
+    def test_converts_values_by_field_type(self):
+        """Test that RichText, Score and Number values are converted for Ashby."""
+        result = extract_field_submissions_for_ashby(STATE_VALUES, FORM_DEFINITION)
+
+        assert result == [
+            {"path": "notes", "value": {"type": "PlainText", "value": "Great call"}},
+            {"path": "score", "value": {"score": 3}},
+            {"path": "years", "value": 5},
+            {"path": "remote", "value": False},
+        ]
@@ -0,0 +1,122 @@
+"""Unit tests for Slack view builders."""
+
+import copy
+from datetime import UTC, datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.clients import slack_views
+from app.clients.slack_views import (
+    build_feedback_modal,
+    clear_form_skeleton_cache,
+    validate_message_length,
+)
+
+FORM_DEFINITION = {
+    "id": "form_skeleton_test",
+    "title": "Interview Feedback",
+    "formDefinition": {
+        "sections": [
+            {
+                "title": "Assessment",
+                "fields": [
+                    {
+                        "field": {"path": "notes", "type": "RichText", "title": "Notes"},
+                        "isRequired": True,
+                    },
+                    {
+                        "field": {"path": "score", "type": "Score", "title": "Score"},
+                        "isRequired": True,
+                    },
+                ],
+            }
+        ]
+    },
+}
+
+CANDIDATE = {"id": "cand_123", "name": "Test Candidate"}
+
+INTERVIEW = {
+    "event_id": "event_123",
+    "form_definition_id": "form_skeleton_test",
+    "application_id": "app_123",
+    "interviewer_id": "interviewer_123",
+    "interview_title": "Technical Interview",
+    "start_time": datetime(2024, 10, 19, 14, 30, tzinfo=UTC),
+}
+
+
+def _input_blocks(view):
+    return [block for block in view["blocks"] if block["type"] == "input"]
+
+
+class TestBuildFeedbackModalSkeleton:
+    """Tests for cached form skeletons in build_feedback_modal."""
+
+    @pytest.mark.asyncio
+    async def test_draft_values_overlay_cached_skeleton(self):
+        """Test that drafts apply on top of a cached skeleton without leaking into it."""
+        clear_form_skeleton_cache()
+
+        await build_feedback_modal(FORM_DEFINITION, CANDIDATE, INTERVIEW)
+        with_draft = await build_feedback_modal(
+            FORM_DEFINITION, CANDIDATE, INTERVIEW, draft_values={"notes": "Strong answers"}
+        )
+        without_draft = await build_feedback_modal(FORM_DEFINITION, CANDIDATE, INTERVIEW)
+
+        assert _input_blocks(with_draft)[0]["element"]["initial_value"] == "Strong answers"
+        assert "initial_value" not in _input_blocks(without_draft)[0]["element"]
+        assert [b["block_id"] for b in _input_blocks(without_draft)] == [
+            "field_notes",
+            "field_score",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_equal_definition_reuses_skeleton(self):
+        """Test that an equal definition loaded as a new object hits the cache."""
+        clear_form_skeleton_cache()
+        first = await build_feedback_modal(FORM_DEFINITION, CANDIDATE, INTERVIEW)
+        second = await build_feedback_modal(copy.deepcopy(FORM_DEFINITION), CANDIDATE, INTERVIEW)
+
+        assert _input_blocks(first)[1]["element"] is _input_blocks(second)[1]["element"]
+
+    @pytest.mark.asyncio
+    async def test_changed_definition_rebuilds_skeleton(self):
+        """Test that a definition edited in place with the same id is not served stale blocks."""
+        clear_form_skeleton_cache()
+        definition = copy.deepcopy(FORM_DEFINITION)
+        await build_feedback_modal(definition, CANDIDATE, INTERVIEW)
+
+        definition["formDefinition"]["sections"][0]["fields"] = [
+            {
+                "field": {"path": "summary", "type": "String", "title": "Sum"},
+                "isRequired": False,
+            }
+        ]
+        view = await build_feedback_modal(definition, CANDIDATE, INTERVIEW)
+
+        assert [b["block_id"] for b in _input_blocks(view)] == ["field_summary"]
+
+
+class TestValidateMessageLength:
+    """Tests for validate_message_length."""
+
+    def test_short_message_with_long_text_is_flagged(self, monkeypatch):
+        """Test that a few blocks of very long text still trip the size warning."""
+        logger = MagicMock()
+        monkeypatch.setattr(slack_views, "logger", logger)
+        blocks = [{"type": "section", "text": {"type": "mrkdwn", "text": "x" * 36000}}]
+
+        assert validate_message_length(blocks) is blocks
+        logger.warning.assert_called_once()
+        assert logger.warning.call_args.args == ("message_too_large",)
+
+    def test_small_message_passes_silently(self, monkeypatch):
+        """Test that an ordinary message is returned without a warning."""
+        logger = MagicMock()
+        monkeypatch.setattr(slack_views, "logger", logger)
+        blocks = [{"type": "section", "text": {"type": "mrkdwn", "text": "Reminder"}}]
+
+        assert validate_message_length(blocks) is blocks
+        logger.warning.assert_not_called()
@@ -0,0 +1,79 @@
+"""Unit tests for sync service helpers."""
+
+import asyncio
+import gc
+from contextlib import aclosing
+
+import pytest
+
+from app.services.sync import _ashby_pages, sync_job_info
+from tests.fixtures.factories import create_ashby_api_response
+
+
+class TestSyncJobInfoCache:
+    """Tests for the job.info TTL cache."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_call(self, mock_ashby_client):
+        """Test that concurrent and repeat lookups for a job hit the API once."""
+        mock_ashby_client.add_response("job.info", create_ashby_api_response("job.info"))
+
+        results = await asyncio.gather(*(sync_job_info("job_test") for _ in range(3)))
+        again = await sync_job_info("job_test")
+
+        assert all(r == {"id": "job_test", "title": "Software Engineer"} for r in results)
+        assert again == results[0]
+        assert mock_ashby_client.get_call_count("job.info") == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_lookup_cached_briefly(self, mock_ashby_client):
+        """Test that a failed lookup returns None and is not retried immediately."""
+        mock_ashby_client.add_response(
+            "job.info", create_ashby_api_response("job.info", success=False)
+        )
+
+        assert await sync_job_info("job_missing") is None
+        assert await sync_job_info("job_missing") is None
+        assert mock_ashby_client.get_call_count("job.info") == 1
+
+
+class TestAshbyPages:
+    """Tests for the prefetching Ashby pager."""
+
+    @pytest.mark.asyncio
+    async def test_early_stop_retrieves_failed_prefetch(self, monkeypatch):
+        """Test that stopping early doesn't leave a failing prefetch's error unretrieved."""
+
+        async def post(endpoint, json_data):
+            if json_data["cursor"] is None:
+                return {
+                    "success": True,
+                    "results": [],
+                    "moreDataAvailable": True,
+                    "nextCursor": "c2",
+                }
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                # e.g. the HTTP connection erroring while it is torn down
+                raise ConnectionResetError("connection reset during cancel") from None
+
+        monkeypatch.setattr("app.services.sync.ashby_client.post", post)
+        loop = asyncio.get_running_loop()
+        unhandled = []
+        previous_handler = loop.get_exception_handler()
+        loop.set_exception_handler(lambda _loop, context: unhandled.append(context))
+
+        try:
+            async with aclosing(_ashby_pages("interview.list")) as pages:
+                async for _ in pages:
+                    # Let the prefetch start before the consumer stops
+                    await asyncio.sleep(0)
+                    break
+            for _ in range(3):
+                await asyncio.sleep(0)
+            gc.collect()
+        finally:
+            loop.set_exception_handler(previous_handler)
+
+        assert unhandled == []